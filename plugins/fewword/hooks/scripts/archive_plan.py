@@ -10,8 +10,8 @@ from __future__ import annotations
 
 import os
 import shutil
+import time
 from pathlib import Path
-from datetime import datetime
 
 
 def main():
@@ -39,7 +39,7 @@ def main():
         return
 
     # Generate timestamp for archive filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = time.strftime('%Y%m%d_%H%M%S')
     archive_file = archive_dir / f'archived_{timestamp}.yaml'
 
     # Move the plan file to archive
@@ -21,6 +21,7 @@ Constraints:
 from __future__ import annotations
 
 import json
+import mmap
 import os
 import re
 import shutil
@@ -35,8 +36,66 @@ def get_cwd():
     return os.environ.get('FEWWORD_CWD', os.getcwd())
 
 
+# orjson is optional but several times faster at encoding; fall back to
+# compact stdlib json (same wire format, just without the spaces)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Directories already confirmed this process - skip repeat mkdir walks
+_DIRS_READY: set = set()
+
+
+def _ensure_dir(path: Path):
+    """mkdir -p with per-process existence caching (mkdir stats every parent)."""
+    key = str(path)
+    if key in _DIRS_READY:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY.add(key)
+
+
+def _jsonl_append(path: Path, entry: dict):
+    """Append one JSON object to a .jsonl file with a single write syscall.
+
+    O_APPEND writes below PIPE_BUF are atomic on POSIX, so concurrent hook
+    processes can't interleave lines. Compact separators keep entries small.
+    """
+    _ensure_dir(path.parent)
+
+    payload = _dumps(entry) + b'\n'
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _counter_file(cwd: str) -> Path:
+    """Sidecar file holding the running auto-pin count (O(1) reads)."""
+    return Path(cwd) / '.fewword' / 'index' / 'auto_pin_count'
+
+
 def count_auto_pinned(cwd: str) -> int:
-    """Count number of auto-pinned files in manifest."""
+    """Count number of auto-pinned files in manifest.
+
+    Reads the sidecar counter maintained by perform_auto_pin when present;
+    otherwise falls back to scanning the manifest and rebuilds the counter.
+    The scan is byte-level: auto-pin entries are the only lines containing
+    "auto_pinned", so full JSON decode is only needed on candidate lines.
+    """
+    counter = _counter_file(cwd)
+    try:
+        return int(counter.read_text())
+    except (FileNotFoundError, OSError, ValueError):
+        pass
+
     manifest = Path(cwd) / '.fewword' / 'index' / 'tool_outputs.jsonl'
     count = 0
 
@@ -44,8 +103,10 @@ def count_auto_pinned(cwd: str) -> int:
         return 0
 
     try:
-        with open(manifest, 'r') as f:
+        with open(manifest, 'rb') as f:
             for line in f:
+                if b'"auto_pinned"' not in line:
+                    continue
                 try:
                     entry = json.loads(line)
                     if entry.get('type') == 'pin' and entry.get('auto_pinned'):
@@ -55,74 +116,140 @@ def count_auto_pinned(cwd: str) -> int:
     except (FileNotFoundError, OSError):
         pass
 
+    try:
+        _ensure_dir(counter.parent)
+        counter.write_text(str(count))
+    except OSError:
+        pass
+
     return count
 
 
+# Sentinel key used to stash normalized auto_pin rules on the config dict
+_NORMALIZED_KEY = '__fw_auto_pin_normalized'
+
+# Only scan the first 100KB of an output for the match pattern
+_MATCH_SCAN_LIMIT = 102400
+
+
+def _normalize_auto_pin(config: Dict) -> Dict:
+    """Normalize auto_pin rules once per config object.
+
+    List-ish fields become frozensets, size_min is coerced to int, and the
+    match pattern is compiled up front, so should_auto_pin does hashed
+    lookups plus one compiled search instead of re-normalizing per command.
+    The result is cached on the config dict under a sentinel key.
+    """
+    cached = config.get(_NORMALIZED_KEY)
+    if cached is not None:
+        return cached
+
+    auto_pin_config = config.get('auto_pin') or {}
+
+    exit_codes = auto_pin_config.get('exit_codes', [])
+    if not isinstance(exit_codes, (list, tuple, set)):
+        exit_codes = [exit_codes]
+    cmds = auto_pin_config.get('cmds', [])
+    if not isinstance(cmds, (list, tuple, set)):
+        cmds = [cmds]
+
+    size_min = auto_pin_config.get('size_min', 0)
+    try:
+        size_min = int(size_min)
+    except (ValueError, TypeError):
+        size_min = 0
+
+    match_pattern = auto_pin_config.get('match', '')
+    match_re = None
+    match_re_bytes = None
+    if match_pattern:
+        try:
+            match_re = re.compile(match_pattern)
+        except re.error:
+            match_re = None
+        # Bytes twin for scanning mmap'd output files without decoding
+        try:
+            match_re_bytes = re.compile(match_pattern.encode())
+        except (re.error, UnicodeEncodeError):
+            match_re_bytes = None
+
+    normalized = {
+        'enabled': any([
+            auto_pin_config.get('on_fail'),
+            match_pattern,
+            cmds,
+            exit_codes,
+            size_min,
+        ]),
+        'on_fail': bool(auto_pin_config.get('on_fail')),
+        'exit_codes': frozenset(exit_codes),
+        'cmds': frozenset(cmds),
+        'size_min': size_min,
+        'match': match_pattern,
+        'match_re': match_re,
+        'match_re_bytes': match_re_bytes,
+        'max_files': auto_pin_config.get('max_files', 50),
+    }
+    config[_NORMALIZED_KEY] = normalized
+    return normalized
+
+
 def should_auto_pin(
     exit_code: int,
     cmd: str,
     cmd_group: str,
     output_bytes: int,
-    output_content: Optional[str],
+    output_content: Optional[object],
     config: Dict,
     cwd: str
 ) -> tuple[bool, str]:
     """
     Determine if output should be auto-pinned.
 
+    output_content may be a str or any bytes-like buffer (e.g. an mmap);
+    only its first 100KB is scanned against the match pattern.
+
     Returns (should_pin, reason).
     """
-    auto_pin_config = config.get('auto_pin', {})
+    rules = _normalize_auto_pin(config)
 
     # Check if auto-pin is disabled
-    if not any([
-        auto_pin_config.get('on_fail'),
-        auto_pin_config.get('match'),
-        auto_pin_config.get('cmds'),
-        auto_pin_config.get('exit_codes'),
-        auto_pin_config.get('size_min')
-    ]):
+    if not rules['enabled']:
         return False, ""
 
     # Check max_files limit
-    max_files = auto_pin_config.get('max_files', 50)
+    max_files = rules['max_files']
     current_count = count_auto_pinned(cwd)
     if current_count >= max_files:
         return False, f"max auto-pinned files reached ({max_files})"
 
     # Check on_fail
-    if auto_pin_config.get('on_fail') and exit_code != 0:
+    if rules['on_fail'] and exit_code != 0:
         return True, "auto_pin.on_fail"
 
     # Check exit_codes
-    exit_codes = auto_pin_config.get('exit_codes', [])
-    exit_codes = exit_codes if isinstance(exit_codes, (list, tuple, set)) else [exit_codes]
-    if exit_codes and exit_code in exit_codes:
+    if exit_code in rules['exit_codes']:
         return True, f"auto_pin.exit_codes ({exit_code})"
 
     # Check cmds
-    cmds = auto_pin_config.get('cmds', [])
-    cmds = cmds if isinstance(cmds, (list, tuple, set)) else [cmds]
-    if cmds and (cmd in cmds or cmd_group in cmds):
+    cmds = rules['cmds']
+    if cmd in cmds or cmd_group in cmds:
         return True, f"auto_pin.cmds ({cmd})"
 
     # Check size_min
-    size_min = auto_pin_config.get('size_min', 0)
-    try:
-        size_min = int(size_min)
-    except (ValueError, TypeError):
-        size_min = 0
+    size_min = rules['size_min']
     if size_min and output_bytes >= size_min:
         return True, f"auto_pin.size_min ({output_bytes} >= {size_min})"
 
-    # Check match pattern
-    match_pattern = auto_pin_config.get('match', '')
-    if match_pattern and output_content:
-        try:
-            if re.search(match_pattern, output_content):
-                return True, f"auto_pin.match ({match_pattern})"
-        except re.error:
-            pass
+    # Check match pattern (output_content may be a str or an mmap'd buffer)
+    if output_content:
+        if isinstance(output_content, str):
+            if rules['match_re'] is not None and \
+                    rules['match_re'].search(output_content, 0, _MATCH_SCAN_LIMIT):
+                return True, f"auto_pin.match ({rules['match']})"
+        elif rules['match_re_bytes'] is not None and \
+                rules['match_re_bytes'].search(output_content, 0, _MATCH_SCAN_LIMIT):
+            return True, f"auto_pin.match ({rules['match']})"
 
     return False, ""
 
@@ -144,7 +271,7 @@ def perform_auto_pin(
 
     # Create pinned directory
     pinned_dir = Path(cwd) / '.fewword' / 'memory' / 'pinned'
-    pinned_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(pinned_dir)
 
     # Copy file to pinned (don't move - leave in scratch until TTL)
     # Include output_id in filename to prevent collisions (same cmd can have multiple pinned outputs)
@@ -169,13 +296,21 @@ def perform_auto_pin(
 
     # P1 fix #27: json.dumps() never raises JSONDecodeError - catch TypeError for non-serializable objects
     try:
-        manifest.parent.mkdir(parents=True, exist_ok=True)
-        with open(manifest, 'a') as f:
-            f.write(json.dumps(pin_entry) + '\n')
-        return True
+        _jsonl_append(manifest, pin_entry)
     except (IOError, OSError, TypeError):
         return False
 
+    # Bump the sidecar counter so count_auto_pinned stays O(1)
+    counter = _counter_file(cwd)
+    try:
+        counter.write_text(str(int(counter.read_text()) + 1))
+    except (FileNotFoundError, OSError, ValueError):
+        # Counter missing/corrupt: rescan (includes the entry just written)
+        # and let count_auto_pinned rebuild the sidecar
+        count_auto_pinned(cwd)
+
+    return True
+
 
 def auto_pin_check(
     output_id: str,
@@ -192,28 +327,36 @@ def auto_pin_check(
 
     Returns reason if pinned, None otherwise.
     """
-    # Read output content for pattern matching (only if match pattern exists)
+    # mmap output for pattern matching (only if a match pattern is set);
+    # the bytes regex scans the page cache in place - no read or decode
     output_content = None
-    match_pattern = config.get('auto_pin', {}).get('match', '')
-    if match_pattern:
+    fobj = None
+    mm = None
+    if _normalize_auto_pin(config)['match_re_bytes'] is not None:
         full_path = Path(cwd) / output_path
-        if full_path.exists():
-            try:
-                # Only read first 100KB for pattern matching
-                with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
-                    output_content = f.read(102400)
-            except (FileNotFoundError, OSError, UnicodeDecodeError):
-                pass
-
-    should_pin, reason = should_auto_pin(
-        exit_code=exit_code,
-        cmd=cmd,
-        cmd_group=cmd_group,
-        output_bytes=output_bytes,
-        output_content=output_content,
-        config=config,
-        cwd=cwd
-    )
+        try:
+            fobj = open(full_path, 'rb')
+            mm = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+            output_content = mm
+        except (FileNotFoundError, OSError, ValueError):
+            # ValueError: empty file can't be mmap'd - nothing to match
+            pass
+
+    try:
+        should_pin, reason = should_auto_pin(
+            exit_code=exit_code,
+            cmd=cmd,
+            cmd_group=cmd_group,
+            output_bytes=output_bytes,
+            output_content=output_content,
+            config=config,
+            cwd=cwd
+        )
+    finally:
+        if mm is not None:
+            mm.close()
+        if fobj is not None:
+            fobj.close()
 
     if should_pin:
         if perform_auto_pin(output_id, output_path, reason, cwd):
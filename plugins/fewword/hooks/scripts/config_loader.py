@@ -15,19 +15,24 @@ Supports Python 3.11+ with tomllib (stdlib), falls back to JSON for older Python
 
 from __future__ import annotations
 
-import copy
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
 
-# Try to import tomllib (Python 3.11+)
-try:
-    import tomllib
-    HAS_TOML = True
-except ImportError:
-    HAS_TOML = False
+# tomllib is stdlib from Python 3.11, so availability is a version check -
+# no need to import it at module load. The import itself happens lazily on
+# the first TOML read, so JSON-only (and config-less) setups never pay it,
+# and this module is imported by every hook spawn.
+HAS_TOML = sys.version_info >= (3, 11)
+_tomllib = None
+
+# Home resolved once at import: Path.home() re-derives it (env lookup, and
+# potentially the pwd database) on every call, and three spots need it
+_HOME = Path(os.environ.get('HOME') or os.path.expanduser('~'))
 
 
 # === Default Configuration ===
@@ -91,37 +96,85 @@ DEFAULTS = {
 }
 
 
-def _deep_merge(base: Dict, overlay: Dict) -> Dict:
-    """Deep merge overlay into base, returning new dict."""
-    result = copy.deepcopy(base)
+def _freeze(value):
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """Inverse of _freeze: materialize plain dicts and lists."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Read-only view of DEFAULTS shared by every no-override load (the common
+# case: no config files, no FEWWORD_* vars). Dicts become MappingProxyType
+# and lists become tuples so the shared instance can't be mutated by accident.
+_DEFAULTS_FROZEN = _freeze(DEFAULTS)
+
+
+def _fast_clone(d: Dict) -> Dict:
+    """Deep-clone a plain config tree (dict/list/scalar only).
+
+    copy.deepcopy walks a memo dict and dispatches through __reduce_ex__ for
+    every node - wildly oversized for config data. `type(v) is dict` skips the
+    isinstance MRO walk; values are never dict subclasses here.
+    """
+    return {
+        k: (_fast_clone(v) if type(v) is dict
+            else list(v) if type(v) is list
+            else v)
+        for k, v in d.items()
+    }
+
+
+def _merge_into(result: Dict, overlay: Dict) -> None:
+    """Deep merge overlay into result in place (result is already a clone)."""
     for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+        existing = result.get(key)
+        if type(existing) is dict and type(value) is dict:
+            _merge_into(existing, value)
         else:
             result[key] = value
+
+
+def _deep_merge(base: Dict, overlay: Dict) -> Dict:
+    """Deep merge overlay into base, returning new dict."""
+    result = _fast_clone(base)
+    _merge_into(result, overlay)
     return result
 
 
 def _load_toml(path: Path) -> Optional[Dict]:
-    """Load TOML file if tomllib available and file exists."""
+    """Load TOML file if tomllib available and file exists.
+
+    Slurp + parse from memory: tomllib.load on a file object does many small
+    buffered reads; one read_bytes + loads is measurably faster. The open
+    itself doubles as the existence check (saves a stat).
+    """
+    global _tomllib
     if not HAS_TOML:
         return None
-    if not path.exists():
-        return None
     try:
-        with open(path, 'rb') as f:
-            return tomllib.load(f)
+        if _tomllib is None:
+            import tomllib
+            _tomllib = tomllib
+        return _tomllib.loads(path.read_bytes().decode('utf-8'))
     except Exception:
         return None
 
 
 def _load_json(path: Path) -> Optional[Dict]:
-    """Load JSON file if exists."""
-    if not path.exists():
-        return None
+    """Load JSON file if exists (json.loads accepts bytes directly)."""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(path.read_bytes())
     except Exception:
         return None
 
@@ -133,186 +186,212 @@ def _load_config_file(directory: Path) -> Tuple[Optional[Dict], Optional[Path]]:
 
     P2 fix #20: Return (config, loaded_path) tuple for accurate source reporting.
     """
+    # One readdir replaces per-candidate probes (a failed open per missing
+    # file); only candidates that actually exist get opened below
+    try:
+        with os.scandir(directory) as it:
+            names = {e.name for e in it if e.name.startswith('.fewwordrc.')}
+    except OSError:
+        return None, None
+    if not names:
+        return None, None
+
     # Try TOML first (only if we have tomllib)
-    toml_path = directory / '.fewwordrc.toml'
-    config = _load_toml(toml_path)
-    if config is not None:
-        return config, toml_path
+    if '.fewwordrc.toml' in names:
+        toml_path = directory / '.fewwordrc.toml'
+        config = _load_toml(toml_path)
+        if config is not None:
+            return config, toml_path
 
     # Fall back to JSON
-    json_path = directory / '.fewwordrc.json'
-    config = _load_json(json_path)
-    if config is not None:
-        return config, json_path
+    if '.fewwordrc.json' in names:
+        json_path = directory / '.fewwordrc.json'
+        config = _load_json(json_path)
+        if config is not None:
+            return config, json_path
 
     return None, None
 
 
+def _parse_int(val: str) -> Optional[int]:
+    try:
+        return int(val)
+    except ValueError:
+        return None
+
+
+def _parse_bool(val: str) -> bool:
+    return val.lower() in ('1', 'true', 'yes', 'on')
+
+
+def _parse_str(val: str) -> str:
+    return val
+
+
+def _parse_list_comma(val: str) -> list:
+    return [x.strip() for x in val.split(',') if x.strip()]
+
+
+def _parse_list_pipe(val: str) -> list:
+    return [x.strip() for x in val.split('|') if x.strip()]
+
+
+def _parse_exit_codes(val: str) -> list:
+    # P1 fix #19: isdigit() drops negative numbers, use try/int() instead
+    codes = []
+    for x in val.split(','):
+        try:
+            codes.append(int(x.strip()))
+        except ValueError:
+            pass
+    return codes
+
+
+# Declarative env-var mapping: FEWWORD_* name -> (section, field, parser).
+# Drives the single-pass loop in _env_to_config; a parser returning None
+# means the value was invalid and the key is skipped.
+_ENV_MAP = {
+    'FEWWORD_INLINE_MAX': ('thresholds', 'inline_max', _parse_int),
+    'FEWWORD_PREVIEW_MIN': ('thresholds', 'preview_min', _parse_int),
+    'FEWWORD_PREVIEW_LINES': ('thresholds', 'preview_lines', _parse_int),
+    'FEWWORD_SCRATCH_MAX_MB': ('thresholds', 'scratch_max_mb', _parse_int),
+    'FEWWORD_RETENTION_SUCCESS_MIN': ('retention', 'success_min', _parse_int),
+    'FEWWORD_RETENTION_FAIL_MIN': ('retention', 'fail_min', _parse_int),
+    'FEWWORD_AUTO_PIN_FAIL': ('auto_pin', 'on_fail', _parse_bool),
+    'FEWWORD_AUTO_PIN_MATCH': ('auto_pin', 'match', _parse_str),
+    'FEWWORD_AUTO_PIN_CMDS': ('auto_pin', 'cmds', _parse_list_comma),
+    'FEWWORD_AUTO_PIN_EXIT': ('auto_pin', 'exit_codes', _parse_exit_codes),
+    'FEWWORD_AUTO_PIN_SIZE_MIN': ('auto_pin', 'size_min', _parse_int),
+    'FEWWORD_AUTO_PIN_MAX': ('auto_pin', 'max_files', _parse_int),
+    'FEWWORD_REDACT_ENABLED': ('redaction', 'enabled', _parse_bool),
+    'FEWWORD_REDACT_PATTERNS': ('redaction', 'patterns', _parse_list_pipe),
+    'FEWWORD_REDACT_REPLACEMENT': ('redaction', 'replacement', _parse_str),
+    'FEWWORD_DENY_CMDS': ('deny', 'cmds', _parse_list_comma),
+    'FEWWORD_DENY_PATTERNS': ('deny', 'patterns', _parse_list_pipe),
+    'FEWWORD_OPEN_CMD': ('pointer', 'open_cmd', _parse_str),
+    'FEWWORD_SHOW_PATH': ('pointer', 'show_path', _parse_bool),
+    'FEWWORD_VERBOSE_POINTER': ('pointer', 'verbose', _parse_bool),
+    'FEWWORD_PEEK_ON_POINTER': ('pointer', 'peek_on_pointer', _parse_bool),
+    'FEWWORD_PEEK_TIER2_LINES': ('pointer', 'peek_tier2_lines', _parse_int),
+    'FEWWORD_PEEK_TIER3_LINES': ('pointer', 'peek_tier3_lines', _parse_int),
+    'FEWWORD_COMPRESS_ENABLED': ('compression', 'enabled', _parse_bool),
+    'FEWWORD_COMPRESS_MIN': ('compression', 'min_bytes', _parse_int),
+    'FEWWORD_COMPRESS_LEVEL': ('compression', 'level', _parse_int),
+    'FEWWORD_MANIFEST_MAX_MB': ('manifest', 'max_mb', _parse_int),
+    'FEWWORD_MANIFEST_KEEP_ROTATED': ('manifest', 'keep_rotated', _parse_int),
+}
+
+
 def _env_to_config() -> Dict:
     """
     Convert FEWWORD_* environment variables to config dict.
 
-    Mapping:
-    - FEWWORD_INLINE_MAX -> thresholds.inline_max
-    - FEWWORD_PREVIEW_MIN -> thresholds.preview_min
-    - FEWWORD_PREVIEW_LINES -> thresholds.preview_lines
-    - FEWWORD_SCRATCH_MAX_MB -> thresholds.scratch_max_mb
-    - FEWWORD_RETENTION_SUCCESS_MIN -> retention.success_min
-    - FEWWORD_RETENTION_FAIL_MIN -> retention.fail_min
-    - FEWWORD_AUTO_PIN_FAIL -> auto_pin.on_fail
-    - FEWWORD_AUTO_PIN_MATCH -> auto_pin.match
-    - FEWWORD_AUTO_PIN_CMDS -> auto_pin.cmds (comma-separated)
-    - FEWWORD_AUTO_PIN_EXIT -> auto_pin.exit_codes (comma-separated)
-    - FEWWORD_AUTO_PIN_SIZE_MIN -> auto_pin.size_min
-    - FEWWORD_AUTO_PIN_MAX -> auto_pin.max_files
-    - FEWWORD_REDACT_ENABLED -> redaction.enabled
-    - FEWWORD_REDACT_PATTERNS -> redaction.patterns (pipe-separated)
-    - FEWWORD_REDACT_REPLACEMENT -> redaction.replacement
-    - FEWWORD_DENY_CMDS -> deny.cmds (comma-separated)
-    - FEWWORD_DENY_PATTERNS -> deny.patterns (pipe-separated)
-    - FEWWORD_OPEN_CMD -> pointer.open_cmd
-    - FEWWORD_SHOW_PATH -> pointer.show_path
-    - FEWWORD_VERBOSE_POINTER -> pointer.verbose
-    - FEWWORD_PEEK_ON_POINTER -> pointer.peek_on_pointer
-    - FEWWORD_PEEK_TIER2_LINES -> pointer.peek_tier2_lines
-    - FEWWORD_PEEK_TIER3_LINES -> pointer.peek_tier3_lines
+    One filtered pass over os.environ replaces per-variable lookups - in the
+    typical case (no FEWWORD_* vars set) the function short-circuits after a
+    single prefix scan. See _ENV_MAP for the variable -> key mapping.
     """
+    fw = {k: v for k, v in os.environ.items() if k.startswith('FEWWORD_')}
+    if not fw:
+        return {}
+
     config: Dict[str, Any] = {}
+    for key, val in fw.items():
+        spec = _ENV_MAP.get(key)
+        if spec is None:
+            continue
+        section, field, parse = spec
+        parsed = parse(val)
+        if parsed is not None:
+            config.setdefault(section, {})[field] = parsed
+    return config
 
-    def _int(key: str) -> Optional[int]:
-        val = os.environ.get(key)
-        if val is None:
-            return None
-        try:
-            return int(val)
-        except ValueError:
-            return None
-
-    def _bool(key: str) -> Optional[bool]:
-        val = os.environ.get(key)
-        if val is None:
-            return None
-        return val.lower() in ('1', 'true', 'yes', 'on')
-
-    def _str(key: str) -> Optional[str]:
-        return os.environ.get(key)
-
-    def _list_comma(key: str) -> Optional[list]:
-        val = os.environ.get(key)
-        if val is None:
-            return None
-        return [x.strip() for x in val.split(',') if x.strip()]
-
-    def _list_pipe(key: str) -> Optional[list]:
-        val = os.environ.get(key)
-        if val is None:
-            return None
-        return [x.strip() for x in val.split('|') if x.strip()]
-
-    # Thresholds
-    thresholds = {}
-    if (v := _int('FEWWORD_INLINE_MAX')) is not None:
-        thresholds['inline_max'] = v
-    if (v := _int('FEWWORD_PREVIEW_MIN')) is not None:
-        thresholds['preview_min'] = v
-    if (v := _int('FEWWORD_PREVIEW_LINES')) is not None:
-        thresholds['preview_lines'] = v
-    if (v := _int('FEWWORD_SCRATCH_MAX_MB')) is not None:
-        thresholds['scratch_max_mb'] = v
-    if thresholds:
-        config['thresholds'] = thresholds
-
-    # Retention
-    retention = {}
-    if (v := _int('FEWWORD_RETENTION_SUCCESS_MIN')) is not None:
-        retention['success_min'] = v
-    if (v := _int('FEWWORD_RETENTION_FAIL_MIN')) is not None:
-        retention['fail_min'] = v
-    if retention:
-        config['retention'] = retention
-
-    # Auto-pin
-    auto_pin = {}
-    if (v := _bool('FEWWORD_AUTO_PIN_FAIL')) is not None:
-        auto_pin['on_fail'] = v
-    if (v := _str('FEWWORD_AUTO_PIN_MATCH')) is not None:
-        auto_pin['match'] = v
-    if (v := _list_comma('FEWWORD_AUTO_PIN_CMDS')) is not None:
-        auto_pin['cmds'] = v
-    if (v := _list_comma('FEWWORD_AUTO_PIN_EXIT')) is not None:
-        # P1 fix #19: isdigit() drops negative numbers, use try/int() instead
-        exit_codes = []
-        for x in v:
-            try:
-                exit_codes.append(int(x))
-            except ValueError:
-                pass
-        auto_pin['exit_codes'] = exit_codes
-    if (v := _int('FEWWORD_AUTO_PIN_SIZE_MIN')) is not None:
-        auto_pin['size_min'] = v
-    if (v := _int('FEWWORD_AUTO_PIN_MAX')) is not None:
-        auto_pin['max_files'] = v
-    if auto_pin:
-        config['auto_pin'] = auto_pin
-
-    # Redaction
-    redaction = {}
-    if (v := _bool('FEWWORD_REDACT_ENABLED')) is not None:
-        redaction['enabled'] = v
-    if (v := _list_pipe('FEWWORD_REDACT_PATTERNS')) is not None:
-        redaction['patterns'] = v
-    if (v := _str('FEWWORD_REDACT_REPLACEMENT')) is not None:
-        redaction['replacement'] = v
-    if redaction:
-        config['redaction'] = redaction
-
-    # Deny
-    deny = {}
-    if (v := _list_comma('FEWWORD_DENY_CMDS')) is not None:
-        deny['cmds'] = v
-    if (v := _list_pipe('FEWWORD_DENY_PATTERNS')) is not None:
-        deny['patterns'] = v
-    if deny:
-        config['deny'] = deny
-
-    # Pointer
-    pointer = {}
-    if (v := _str('FEWWORD_OPEN_CMD')) is not None:
-        pointer['open_cmd'] = v
-    if (v := _bool('FEWWORD_SHOW_PATH')) is not None:
-        pointer['show_path'] = v
-    if (v := _bool('FEWWORD_VERBOSE_POINTER')) is not None:
-        pointer['verbose'] = v
-    if (v := _bool('FEWWORD_PEEK_ON_POINTER')) is not None:
-        pointer['peek_on_pointer'] = v
-    if (v := _int('FEWWORD_PEEK_TIER2_LINES')) is not None:
-        pointer['peek_tier2_lines'] = v
-    if (v := _int('FEWWORD_PEEK_TIER3_LINES')) is not None:
-        pointer['peek_tier3_lines'] = v
-    if pointer:
-        config['pointer'] = pointer
-
-    # Compression
-    compression = {}
-    if (v := _bool('FEWWORD_COMPRESS_ENABLED')) is not None:
-        compression['enabled'] = v
-    if (v := _int('FEWWORD_COMPRESS_MIN')) is not None:
-        compression['min_bytes'] = v
-    if (v := _int('FEWWORD_COMPRESS_LEVEL')) is not None:
-        compression['level'] = v
-    if compression:
-        config['compression'] = compression
-
-    # Manifest
-    manifest = {}
-    if (v := _int('FEWWORD_MANIFEST_MAX_MB')) is not None:
-        manifest['max_mb'] = v
-    if (v := _int('FEWWORD_MANIFEST_KEEP_ROTATED')) is not None:
-        manifest['keep_rotated'] = v
-    if manifest:
-        config['manifest'] = manifest
 
-    return config
+# === Disk cache for the merged config ===
+#
+# Every hook invocation is a fresh Python process, so the in-process cache in
+# get_config() never survives between tool calls. Persist the merged result to
+# ~/.cache/fewword/ keyed by the mtimes of the four candidate config files plus
+# the FEWWORD_* environment; a key match means the merge would produce the same
+# dict, so we can skip the file parsing and deep-merge layers entirely.
+
+# Bump when DEFAULTS or the merge semantics change, so stale caches from an
+# older plugin version are ignored.
+_CACHE_VERSION = 1
+
+
+def _dir_config_mtimes(directory) -> tuple:
+    """(toml_mtime_ns, json_mtime_ns) for a directory's rc files, 0 if absent.
+
+    One readdir replaces two stat probes - same batching _load_config_file
+    uses, so the common no-config case costs a single syscall per directory.
+    """
+    toml_mtime = json_mtime = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.name == '.fewwordrc.toml':
+                        toml_mtime = entry.stat().st_mtime_ns
+                    elif entry.name == '.fewwordrc.json':
+                        json_mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return toml_mtime, json_mtime
+
+
+def _config_cache_key(cwd: Optional[str]) -> tuple:
+    """Build a cache key that changes iff a fresh load would differ."""
+    mtimes = _dir_config_mtimes(_HOME)
+    if cwd:
+        mtimes += _dir_config_mtimes(cwd)
+
+    env_items = tuple(sorted(
+        (k, v) for k, v in os.environ.items() if k.startswith('FEWWORD_')
+    ))
+    return (_CACHE_VERSION, HAS_TOML, mtimes, env_items)
+
+
+def _config_cache_file(cwd: Optional[str]) -> Path:
+    """Per-cwd cache file under XDG_CACHE_HOME (or ~/.cache)."""
+    import hashlib
+    base = Path(os.environ.get('XDG_CACHE_HOME') or _HOME / '.cache')
+    name = hashlib.sha1((cwd or '').encode()).hexdigest()[:16] + '.pkl'
+    return base / 'fewword' / name
+
+
+def _read_config_cache(cache_file: Path, key: tuple):
+    """Return (config, sources) on a key match, else None."""
+    import pickle
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, config, sources = pickle.load(f)
+        if cached_key == key:
+            return config, sources
+    except Exception:
+        pass
+    return None
+
+
+def _write_config_cache(cache_file: Path, key: tuple, config: Dict, sources: Dict):
+    """Best-effort cache write (atomic rename; failures are ignored)."""
+    import pickle
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump((key, config, sources), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted config key once per process - get() is called with the
+    same handful of keys repeatedly from hook hot paths."""
+    return tuple(key.split('.'))
 
 
 class FewWordConfig:
@@ -340,35 +419,51 @@ class FewWordConfig:
         3. User config (~/.fewwordrc.toml/.json)
         4. Built-in defaults
         """
-        sources = {}
+        # Disk cache: skip the parse + merge layers entirely when nothing
+        # that feeds the merge has changed since the last process ran it.
+        cache_key = _config_cache_key(cwd)
+        cache_file = _config_cache_file(cwd)
+        cached = _read_config_cache(cache_file, cache_key)
+        if cached is not None:
+            return cls(cached[0], cached[1])
+
+        sources = {'base': 'defaults'}
+
+        # Gather all overlay layers before cloning anything
+        user_config, user_config_path = _load_config_file(_HOME)
+        if cwd:
+            repo_config, repo_config_path = _load_config_file(Path(cwd))
+        else:
+            repo_config, repo_config_path = None, None
+        env_config = _env_to_config()
 
-        # Start with defaults (P0 fix: use deepcopy to prevent nested dict mutation)
-        config = copy.deepcopy(DEFAULTS)
-        sources['base'] = 'defaults'
+        # Fast path: nothing overrides the defaults, so hand out the shared
+        # frozen view - zero cloning and nothing worth caching on disk
+        if not user_config and not repo_config and not env_config:
+            return cls(_DEFAULTS_FROZEN, sources)
+
+        # Clone the defaults once (prevents nested dict mutation); overlays
+        # merge into it in place
+        config = _fast_clone(DEFAULTS)
 
         # Layer 3: User config (~/.fewwordrc.toml or ~/.fewwordrc.json)
-        home = Path.home()
-        user_config, user_config_path = _load_config_file(home)
         if user_config:
-            config = _deep_merge(config, user_config)
+            _merge_into(config, user_config)
             # P2 fix #20: Use actual loaded path instead of checking existence
             sources['user'] = str(user_config_path)
 
         # Layer 2: Repo config (.fewwordrc.toml or .fewwordrc.json in cwd)
-        if cwd:
-            cwd_path = Path(cwd)
-            repo_config, repo_config_path = _load_config_file(cwd_path)
-            if repo_config:
-                config = _deep_merge(config, repo_config)
-                # P2 fix #20: Use actual loaded path instead of checking existence
-                sources['repo'] = str(repo_config_path)
+        if repo_config:
+            _merge_into(config, repo_config)
+            # P2 fix #20: Use actual loaded path instead of checking existence
+            sources['repo'] = str(repo_config_path)
 
         # Layer 1: Environment variables (highest priority)
-        env_config = _env_to_config()
         if env_config:
-            config = _deep_merge(config, env_config)
+            _merge_into(config, env_config)
             sources['env'] = 'FEWWORD_* environment variables'
 
+        _write_config_cache(cache_file, cache_key, config, sources)
         return cls(config, sources)
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -380,14 +475,16 @@ class FewWordConfig:
             config.get('aliases.pytest')  # -> ['py.test', ...]
             config.get('redaction.enabled')  # -> True
         """
-        parts = key.split('.')
+        # Plain subscripting in a try block: the no-exception path costs one
+        # C-level lookup per hop, versus two isinstance/contains calls. Missing
+        # keys raise KeyError; descending into a non-mapping raises TypeError.
         value = self._config
-        for part in parts:
-            if isinstance(value, dict) and part in value:
+        try:
+            for part in _split_key(key):
                 value = value[part]
-            else:
-                return default
-        return value
+            return value
+        except (KeyError, TypeError):
+            return default
 
     def get_section(self, section: str) -> Dict:
         """Get entire config section."""
@@ -399,7 +496,13 @@ class FewWordConfig:
         return self._sources.copy()
 
     def to_dict(self) -> Dict:
-        """Get full config as dict."""
+        """Get full config as a plain mutable dict.
+
+        Materializes real dicts/lists when backed by the frozen defaults view
+        (json.dumps and callers that annotate the dict need mutability).
+        """
+        if type(self._config) is MappingProxyType:
+            return _thaw(self._config)
         return self._config.copy()
 
     def format_sources(self) -> str:
@@ -412,20 +515,29 @@ class FewWordConfig:
 
 # === Convenience functions for direct use ===
 
+# In-process cache keyed by the same signature as the disk cache (config
+# file mtimes + FEWWORD_* env), not just cwd - a config edit mid-process is
+# picked up instead of served stale. Validation costs a few stats, which
+# is noise next to re-running the parse + merge.
 _cached_config: Optional[FewWordConfig] = None
+_cached_key: Optional[tuple] = None
 _cached_cwd: Optional[str] = None
 
 
 def get_config(cwd: Optional[str] = None, force_reload: bool = False) -> FewWordConfig:
     """
-    Get cached config, reloading if cwd changed or force_reload=True.
+    Get cached config, reloading if anything feeding the merge changed
+    (config file mtimes, FEWWORD_* env, cwd) or force_reload=True.
 
     This is the main entry point for other scripts.
     """
-    global _cached_config, _cached_cwd
+    global _cached_config, _cached_key, _cached_cwd
 
-    if force_reload or _cached_config is None or _cached_cwd != cwd:
+    key = _config_cache_key(cwd)
+    if (force_reload or _cached_config is None or _cached_cwd != cwd
+            or _cached_key != key):
         _cached_config = FewWordConfig.load(cwd)
+        _cached_key = key
         _cached_cwd = cwd
 
     return _cached_config
@@ -440,6 +552,13 @@ def get_value(key: str, default: Any = None, cwd: Optional[str] = None) -> Any:
 
 def main():
     """CLI for debugging config loading."""
+    # Fast path: `config_loader.py some.key` - by far the most common
+    # invocation - needs no argparse import or parser construction
+    if len(sys.argv) == 2 and not sys.argv[1].startswith('-'):
+        key = sys.argv[1]
+        print(f"{key} = {FewWordConfig.load(os.getcwd()).get(key)}")
+        return
+
     import argparse
 
     parser = argparse.ArgumentParser(description='FewWord Config Loader')
@@ -49,6 +49,19 @@ try:
 except ImportError:
     pass
 
+# tomllib is stdlib from Python 3.11, so availability is a version check.
+# Resolved lazily on the first TOML read and cached, so the fallback config
+# loader never re-runs import machinery per candidate file.
+_HAS_TOML = sys.version_info >= (3, 11)
+_tomllib = None
+
+def _get_tomllib():
+    global _tomllib
+    if _tomllib is None and _HAS_TOML:
+        import tomllib
+        _tomllib = tomllib
+    return _tomllib
+
 def get_cwd():
     """Get working directory with validation."""
     cwd = os.environ.get('FEWWORD_CWD', os.getcwd())
@@ -79,12 +92,11 @@ def _load_config_from_files(cwd):
         if cfg_path.exists():
             try:
                 if cfg_path.suffix == '.toml':
-                    try:
-                        import tomllib
-                        with open(cfg_path, 'rb') as f:
-                            data = tomllib.load(f)
-                    except ImportError:
+                    tomllib = _get_tomllib()
+                    if tomllib is None:
                         continue
+                    with open(cfg_path, 'rb') as f:
+                        data = tomllib.load(f)
                 else:
                     with open(cfg_path, 'r') as f:
                         data = json.load(f)
@@ -105,12 +117,11 @@ def _load_config_from_files(cwd):
         if cfg_path.exists():
             try:
                 if cfg_path.suffix == '.toml':
-                    try:
-                        import tomllib
-                        with open(cfg_path, 'rb') as f:
-                            data = tomllib.load(f)
-                    except ImportError:
+                    tomllib = _get_tomllib()
+                    if tomllib is None:
                         continue
+                    with open(cfg_path, 'rb') as f:
+                        data = tomllib.load(f)
                 else:
                     with open(cfg_path, 'r') as f:
                         data = json.load(f)
@@ -7,24 +7,54 @@ Usage:
     python3 context_helpers.py resolve "1" ".fewword/index/tool_outputs.jsonl" ".fewword/index/.recent_index"
     python3 context_helpers.py resolve "pytest" ".fewword/index/tool_outputs.jsonl" ".fewword/index/.recent_index"
     python3 context_helpers.py resolve "A1B2C3D4" ".fewword/index/tool_outputs.jsonl" ".fewword/index/.recent_index"
+    printf '%s\n' "$ts1" "$ts2" | python3 context_helpers.py age-batch
 """
 
 from __future__ import annotations
 
+import calendar
+import mmap
+import os
+import struct
 import sys
 import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+# orjson is optional but 5-10x faster at decoding; fall back to the stdlib
+# decoder (hoisted once - json.loads re-dispatches kwargs on every call)
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _json_decode = json.JSONDecoder().decode
+
+    def _loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'replace')
+        return _json_decode(data)
+
 
 def calculate_age(iso_timestamp: str) -> str:
     """Convert ISO timestamp to human-readable age (e.g., '2h', '3d')."""
     try:
-        # Handle both 'Z' suffix and +00:00 format
-        ts = iso_timestamp.replace('Z', '+00:00')
-        created = datetime.fromisoformat(ts)
-        now = datetime.now(timezone.utc)
-        diff = int((now - created).total_seconds())
+        ts = iso_timestamp
+        # Fast path: the standard UTC shape (YYYY-MM-DDTHH:MM:SS[.f]Z or
+        # +00:00). Slicing + timegm is pure integer math - no datetime
+        # objects, no tzinfo machinery. Anything else takes the slow path.
+        if (len(ts) >= 19 and ts[10] == 'T' and ts[13] == ':' and ts[16] == ':'
+                and (ts[-1] == 'Z' or ts.endswith('+00:00'))):
+            epoch = calendar.timegm((
+                int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                int(ts[11:13]), int(ts[14:16]), int(ts[17:19]), 0, 0, 0))
+            diff = int(time.time()) - epoch
+        else:
+            # Handle both 'Z' suffix and +00:00 format
+            created = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+            now = datetime.now(timezone.utc)
+            diff = int((now - created).total_seconds())
 
         if diff < 0:
             return "future"
@@ -64,6 +94,129 @@ def get_index_path(index_path: str) -> str:
     return index_path
 
 
+def _reverse_blocks_iter(f, size: int, blocksize: int = 65536):
+    """Yield (offset, line) pairs from EOF backwards, reading in blocks.
+
+    Fallback for when the file can't be mmapped: keeps memory at O(blocksize)
+    instead of slurping the whole file, and still lets callers stop at the
+    first match near the tail.
+    """
+    carry = b''
+    pos = size
+    while pos > 0:
+        read = min(blocksize, pos)
+        pos -= read
+        f.seek(pos)
+        buf = f.read(read) + carry
+        pieces = buf.split(b'\n')
+        # pieces[0] may be a partial line continuing into the previous block
+        carry = pieces[0]
+        offset = pos + len(carry) + 1
+        starts = []
+        for piece in pieces[1:]:
+            starts.append(offset)
+            offset += len(piece) + 1
+        for i in range(len(starts) - 1, -1, -1):
+            if pieces[i + 1]:
+                yield starts[i], pieces[i + 1]
+    if carry:
+        yield 0, carry
+
+
+def _iter_manifest_reverse(manifest_path: str):
+    """Yield (offset, line) pairs of raw manifest bytes, newest (last) first.
+
+    The manifest can grow to tens of MB (manifest.max_mb defaults to 50) and
+    the entry being looked up is almost always near the tail, so readlines() +
+    reversed() - which materializes the whole file as a list of str - is the
+    wrong shape. mmap + rfind walks line boundaries backwards at C speed and
+    lets callers stop at the first match.
+    """
+    with open(manifest_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file can't be mapped
+            return
+        except OSError:
+            # mmap unavailable (e.g. some network filesystems): read blocks
+            f.seek(0, 2)
+            yield from _reverse_blocks_iter(f, f.tell())
+            return
+        try:
+            end = mm.size()
+            while end > 0:
+                # Skip the newline(s) terminating the line we're about to yield
+                while end > 0 and mm[end - 1] == 0x0A:
+                    end -= 1
+                if end == 0:
+                    break
+                start = mm.rfind(b'\n', 0, end) + 1
+                yield start, mm[start:end]
+                end = start
+        finally:
+            mm.close()
+
+
+# In-process manifest memo: path -> ((mtime_ns, size), by_id, by_cmd).
+# One forward scan builds both maps; primed by the batch modes, where many
+# lookups amortize the scan, and consulted by resolve_id/lookup_entry before
+# they fall back to the early-exit reverse scan. Invalidated whenever the
+# manifest's mtime or size changes.
+_manifest_cache: dict = {}
+
+
+def _load_manifest(manifest_path: str) -> tuple:
+    """Scan the manifest once, building {id: entry} and {cmd: id} maps."""
+    try:
+        st = os.stat(manifest_path)
+    except OSError:
+        return {}, {}
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _manifest_cache.get(manifest_path)
+    if cached and cached[0] == key:
+        return cached[1], cached[2]
+
+    by_id: dict = {}
+    by_cmd: dict = {}
+    try:
+        with open(manifest_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    continue
+                if entry.get('type') != 'offload':
+                    continue
+                hex_id = entry.get('id', '').upper()
+                if hex_id:
+                    # Later lines win, matching the newest-first scans
+                    by_id[hex_id] = entry
+                    cmd = entry.get('cmd')
+                    if cmd:
+                        by_cmd[cmd] = hex_id
+    except OSError:
+        return {}, {}
+    _manifest_cache[manifest_path] = (key, by_id, by_cmd)
+    return by_id, by_cmd
+
+
+def _cached_maps(manifest_path: str):
+    """Return (by_id, by_cmd) if a still-valid memo exists, else None."""
+    cached = _manifest_cache.get(manifest_path)
+    if not cached:
+        return None
+    try:
+        st = os.stat(manifest_path)
+    except OSError:
+        return None
+    if cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1], cached[2]
+    return None
+
+
 def resolve_id(selector: str, manifest_path: str, index_path: str) -> str:
     """
     Resolve selector (number/hex/cmd) to hex ID.
@@ -96,28 +249,43 @@ def resolve_id(selector: str, manifest_path: str, index_path: str) -> str:
                 pass
         return ""
 
-    # Mode 2: Hex ID - validate 8-char hex and return
-    if len(selector) == 8:
-        if all(c in '0123456789ABCDEFabcdef' for c in selector):
+    # Mode 2: Hex ID - validate 8-char hex and return.
+    # bytes.fromhex is one C call instead of a per-char membership loop;
+    # the isalnum guard rejects the whitespace fromhex would tolerate.
+    if len(selector) == 8 and selector.isalnum():
+        try:
+            bytes.fromhex(selector)
             return selector.upper()
+        except ValueError:
+            pass
 
     # Mode 3: Command name - find latest exact match in manifest
+    #
+    # Memoized maps from a previous full scan in this process beat any rescan
+    maps = _cached_maps(manifest_path)
+    if maps is not None:
+        return maps[1].get(selector, "")
+
+    # Substring prefilter: a line that doesn't contain the selector bytes
+    # can't be a match, and `in` on bytes is a C-level memmem - far cheaper
+    # than JSON-parsing every non-matching record. Only safe when the
+    # selector appears verbatim in the serialized JSON (no escaping).
+    sel_bytes = selector.encode()
+    prefilter = selector.isascii() and '"' not in selector and '\\' not in selector
     try:
-        with open(manifest_path, 'r') as f:
-            lines = f.readlines()
-
-        # Search in reverse (most recent first)
-        for line in reversed(lines):
-            line = line.strip()
-            if not line:
+        # Newest-first scan that stops at the first match
+        for _, line in _iter_manifest_reverse(manifest_path):
+            if prefilter and sel_bytes not in line:
+                continue
+            if not line.strip():
                 continue
             try:
-                entry = json.loads(line)
+                entry = _loads(line)
                 # Only match offload entries, not pins or other types
                 if entry.get('type') == 'offload':
                     if entry.get('cmd') == selector:  # Exact match only
                         return entry.get('id', '').upper()
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
     except Exception:
         pass
@@ -125,6 +293,65 @@ def resolve_id(selector: str, manifest_path: str, index_path: str) -> str:
     return ""
 
 
+# Sidecar lookup index: fixed 16-byte records of (8-char uppercase hex id,
+# little-endian u64 byte offset into the manifest). Appended opportunistically
+# whenever a scan resolves an id, so repeat lookups across processes become a
+# single seek instead of re-scanning the manifest. A record whose offset no
+# longer holds its id (e.g. after rotation) is simply ignored.
+_IDX_RECORD = struct.Struct('<8sQ')
+
+
+def _index_path(manifest_path: str) -> str:
+    return manifest_path + '.idx'
+
+
+def _index_lookup(manifest_path: str, hex_id: str) -> dict:
+    """O(1)-ish lookup via the sidecar index; returns {} on any miss."""
+    try:
+        with open(_index_path(manifest_path), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return {}
+
+    needle = hex_id.encode()
+    size = _IDX_RECORD.size
+    # Newest records last; scan backwards over whole records only
+    for pos in range(len(data) - len(data) % size - size, -1, -size):
+        if data[pos:pos + 8] != needle:
+            continue
+        (_, offset) = _IDX_RECORD.unpack_from(data, pos)
+        try:
+            with open(manifest_path, 'rb') as mf:
+                mf.seek(offset)
+                line = mf.readline()
+        except OSError:
+            return {}
+        # Stale guard: trust the offset only if the line really is this entry
+        if needle in line or hex_id.lower().encode() in line:
+            try:
+                entry = _loads(line)
+            except ValueError:
+                return {}
+            if entry.get('type') == 'offload' and entry.get('id', '').upper() == hex_id:
+                return entry
+        return {}
+    return {}
+
+
+def _index_append(manifest_path: str, hex_id: str, offset: int):
+    """Record id -> offset (one atomic O_APPEND write; failures ignored)."""
+    try:
+        payload = _IDX_RECORD.pack(hex_id.encode(), offset)
+        fd = os.open(_index_path(manifest_path),
+                     os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
 def lookup_entry(hex_id: str, manifest_path: str) -> dict:
     """
     Lookup full entry from manifest by hex ID.
@@ -132,19 +359,72 @@ def lookup_entry(hex_id: str, manifest_path: str) -> dict:
     Returns dict with: id, cmd, exit_code, bytes, lines, path, created_at
     """
     hex_id = hex_id.upper()
+
+    # Memoized maps from a previous full scan in this process beat any rescan
+    maps = _cached_maps(manifest_path)
+    if maps is not None:
+        return maps[0].get(hex_id, {})
+
+    # Fast path: sidecar index seek instead of scanning the manifest
+    if len(hex_id) == 8:
+        entry = _index_lookup(manifest_path, hex_id)
+        if entry:
+            return entry
+
+    # Jump straight to occurrences of the id with mm.rfind (C-level memmem)
+    # instead of walking every line boundary in Python - the interpreter only
+    # runs once per candidate hit, which is almost always exactly once.
+    # IDs are stored as one case or the other, never mixed.
+    id_upper = hex_id.encode()
+    id_lower = hex_id.lower().encode()
     try:
-        with open(manifest_path, 'r') as f:
-            for line in reversed(f.readlines()):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    if entry.get('type') == 'offload':
-                        if entry.get('id', '').upper() == hex_id:
-                            return entry
-                except json.JSONDecodeError:
-                    continue
+        with open(manifest_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return {}
+            except OSError:
+                # mmap unavailable: block-reading reverse scan with prefilter
+                f.seek(0, 2)
+                for offset, line in _reverse_blocks_iter(f, f.tell()):
+                    if id_upper not in line and id_lower not in line:
+                        continue
+                    try:
+                        entry = _loads(line)
+                        if entry.get('type') == 'offload':
+                            if entry.get('id', '').upper() == hex_id:
+                                if len(hex_id) == 8:
+                                    _index_append(manifest_path, hex_id, offset)
+                                return entry
+                    except ValueError:
+                        continue
+                return {}
+            try:
+                size = mm.size()
+                pos = size
+                while pos > 0:
+                    # Newest occurrence of either casing before pos
+                    hit = max(mm.rfind(id_upper, 0, pos),
+                              mm.rfind(id_lower, 0, pos))
+                    if hit < 0:
+                        break
+                    # Extract the enclosing line
+                    start = mm.rfind(b'\n', 0, hit) + 1
+                    end = mm.find(b'\n', hit)
+                    if end < 0:
+                        end = size
+                    try:
+                        entry = _loads(mm[start:end])
+                        if entry.get('type') == 'offload':
+                            if entry.get('id', '').upper() == hex_id:
+                                if len(hex_id) == 8:
+                                    _index_append(manifest_path, hex_id, start)
+                                return entry
+                    except ValueError:
+                        pass
+                    pos = hit
+            finally:
+                mm.close()
     except Exception:
         pass
     return {}
@@ -157,6 +437,9 @@ def main():
         print("  age <iso_timestamp>      - Convert timestamp to human age")
         print("  resolve <selector> <manifest> <index> - Resolve ID")
         print("  lookup <hex_id> <manifest> - Get full entry as JSON")
+        print("  age-batch                - Ages for stdin timestamps (one per line)")
+        print("  resolve-batch <manifest> <index> - Resolve stdin selectors")
+        print("  lookup-batch <manifest>  - Lookup stdin hex IDs")
         sys.exit(1)
 
     cmd = sys.argv[1]
@@ -182,6 +465,31 @@ def main():
         else:
             print("{}")
 
+    # Batch modes: one process handles N inputs from stdin instead of paying
+    # ~30-50ms of interpreter startup per entry when rendering a listing
+    elif cmd == "age-batch":
+        out = [calculate_age(line.strip()) if line.strip() else "?"
+               for line in sys.stdin]
+        print('\n'.join(out))
+
+    elif cmd == "resolve-batch":
+        if len(args) >= 2:
+            _load_manifest(args[0])  # one forward scan serves every selector
+            out = [resolve_id(line.strip(), args[0], args[1])
+                   for line in sys.stdin]
+            print('\n'.join(out))
+        else:
+            print("")
+
+    elif cmd == "lookup-batch":
+        if len(args) >= 1:
+            _load_manifest(args[0])  # one forward scan serves every id
+            for line in sys.stdin:
+                entry = lookup_entry(line.strip(), args[0])
+                print(json.dumps(entry) if entry else "{}")
+        else:
+            print("{}")
+
     else:
         print(f"Unknown command: {cmd}", file=sys.stderr)
         sys.exit(1)
@@ -3,13 +3,34 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 import os
 import re
 import sys
-import uuid
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
+
+# orjson is optional but several times faster; fall back to compact stdlib
+# json (same wire format, just without the spaces)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_decode = json.JSONDecoder().decode
+
+    def _loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'replace')
+        return _json_decode(data)
 
 # Add hooks/scripts to path for shared module imports
 _scripts_dir = None
@@ -52,71 +73,83 @@ def get_cwd():
     cwd = os.environ.get('FEWWORD_CWD', os.getcwd())
     return os.path.realpath(os.path.abspath(cwd))
 
+# Compiled once at import rather than per call
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s\-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# tomllib is stdlib from Python 3.11, so availability is a version check.
+# Resolved lazily on the first TOML read and cached, so the fallback config
+# loader never re-runs import machinery per candidate file.
+_HAS_TOML = sys.version_info >= (3, 11)
+_tomllib = None
+
+def _get_tomllib():
+    global _tomllib
+    if _tomllib is None and _HAS_TOML:
+        import tomllib
+        _tomllib = tomllib
+    return _tomllib
+
 def sanitize_for_filename(title: str) -> str:
     """Sanitize title for safe filename use only (not for storage)."""
     # Remove dangerous chars for filename
-    safe = re.sub(r'[^\w\s\-]', '', title)
-    safe = re.sub(r'\s+', '_', safe)
+    safe = _FILENAME_UNSAFE_RE.sub('', title)
+    safe = _WHITESPACE_RE.sub('_', safe)
     return safe[:40]  # Cap length for filename
 
+def _merge_from_paths(paths, config: dict):
+    """
+    Merge redaction settings from the first readable config in paths.
+
+    Opens each candidate directly instead of exists()+open (one syscall,
+    no race); unreadable or unparseable files fall through to the next.
+    """
+    for cfg_path in paths:
+        try:
+            with open(cfg_path, 'rb') as f:
+                raw = f.read()
+            if cfg_path.suffix == '.toml':
+                tomllib = _get_tomllib()
+                if tomllib is None:
+                    continue
+                data = tomllib.loads(raw.decode('utf-8'))
+            else:
+                data = _loads(raw)
+            redaction = data.get('redaction', {})
+            for key in ('enabled', 'patterns', 'replacement'):
+                if key in redaction:
+                    config[key] = redaction[key]
+            return
+        except Exception:
+            continue
+
+@lru_cache(maxsize=8)
+def _file_redaction_config(cwd: str, _mtime_sig: tuple) -> tuple:
+    """
+    File-derived redaction settings, cached per cwd + config file mtimes.
+
+    Returns an immutable (enabled, patterns, replacement) snapshot so
+    cached state can't be mutated by callers.
+    """
+    config = {'enabled': True, 'patterns': [], 'replacement': '[REDACTED]'}
+
+    # User config first (lowest priority), repo config overrides
+    home = Path.home()
+    _merge_from_paths([home / '.fewwordrc.toml', home / '.fewwordrc.json'], config)
+    repo = Path(cwd)
+    _merge_from_paths([repo / '.fewwordrc.toml', repo / '.fewwordrc.json'], config)
+
+    return config['enabled'], tuple(config['patterns']), config['replacement']
+
 def _load_config_from_files(cwd: str) -> dict:
     """
     Fallback config loader when config_loader.py unavailable.
     Uses proper precedence: user config -> repo config -> env vars.
     """
-    config = {'enabled': True, 'patterns': [], 'replacement': '[REDACTED]'}
-
-    # Load user config first (lowest priority)
-    user_paths = [Path.home() / '.fewwordrc.toml', Path.home() / '.fewwordrc.json']
-    for cfg_path in user_paths:
-        if cfg_path.exists():
-            try:
-                if cfg_path.suffix == '.toml':
-                    try:
-                        import tomllib
-                        with open(cfg_path, 'rb') as f:
-                            data = tomllib.load(f)
-                    except ImportError:
-                        continue
-                else:
-                    with open(cfg_path, 'r') as f:
-                        data = json.load(f)
-                redaction = data.get('redaction', {})
-                if 'enabled' in redaction:
-                    config['enabled'] = redaction['enabled']
-                if 'patterns' in redaction:
-                    config['patterns'] = redaction['patterns']
-                if 'replacement' in redaction:
-                    config['replacement'] = redaction['replacement']
-                break
-            except Exception:
-                continue
-
-    # Load repo config (higher priority, overrides user)
-    repo_paths = [Path(cwd) / '.fewwordrc.toml', Path(cwd) / '.fewwordrc.json']
-    for cfg_path in repo_paths:
-        if cfg_path.exists():
-            try:
-                if cfg_path.suffix == '.toml':
-                    try:
-                        import tomllib
-                        with open(cfg_path, 'rb') as f:
-                            data = tomllib.load(f)
-                    except ImportError:
-                        continue
-                else:
-                    with open(cfg_path, 'r') as f:
-                        data = json.load(f)
-                redaction = data.get('redaction', {})
-                if 'enabled' in redaction:
-                    config['enabled'] = redaction['enabled']
-                if 'patterns' in redaction:
-                    config['patterns'] = redaction['patterns']
-                if 'replacement' in redaction:
-                    config['replacement'] = redaction['replacement']
-                break
-            except Exception:
-                continue
+    enabled, patterns, replacement = _file_redaction_config(
+        cwd, _config_mtime_signature(cwd))
+    config = {'enabled': enabled, 'patterns': list(patterns),
+              'replacement': replacement}
 
     # Environment overrides (highest priority)
     env_enabled = os.environ.get('FEWWORD_REDACT_ENABLED')
@@ -172,10 +205,26 @@ def create_redactor(cwd: str):
                     self.patterns.append(re.compile(p))
                 except re.error:
                     pass
+            # All patterns share one replacement, so fold them into a single
+            # alternation: one pass over the text instead of one per pattern.
+            # Combining renumbers groups across the alternation, so fall back
+            # to the per-pattern loop when any pattern uses a backreference
+            # (\1 etc.) or the replacement is a template rather than a
+            # constant (any backslash: \1, \g<name>, ...).
+            self._combined = None
+            raw = [p.pattern for p in self.patterns]
+            if (len(raw) > 1 and '\\' not in self.replacement
+                    and not any(re.search(r'\\\d', p) for p in raw)):
+                try:
+                    self._combined = re.compile('|'.join(f'(?:{p})' for p in raw))
+                except re.error:
+                    self._combined = None
 
         def redact(self, text):
             if not self.enabled or not text:
                 return text, 0
+            if self._combined is not None:
+                return self._combined.subn(self.replacement, text)
             result = text
             count = 0
             for pattern in self.patterns:
@@ -188,11 +237,108 @@ def create_redactor(cwd: str):
         create_redactor._warned_no_redaction = True
     return BasicRedactor(redaction_config)
 
+def _config_mtime_signature(cwd: str) -> tuple:
+    """mtime_ns of each config candidate, so edits invalidate the redactor cache."""
+    sig = []
+    for base in (str(Path.home()), cwd):
+        for name in ('.fewwordrc.toml', '.fewwordrc.json'):
+            try:
+                sig.append(os.stat(os.path.join(base, name)).st_mtime_ns)
+            except OSError:
+                sig.append(0)
+    return tuple(sig)
+
+@lru_cache(maxsize=8)
+def _get_redactor(cwd: str, _mtime_sig: tuple):
+    """Cached redactor per cwd; _mtime_sig keys the cache on config file state."""
+    return create_redactor(cwd)
+
+def _redaction_inert(redactor) -> bool:
+    """True when redact() could never change the text (disabled or no patterns)."""
+    if not getattr(redactor, 'enabled', True):
+        return True
+    patterns = getattr(redactor, '_patterns', None)
+    if patterns is None:
+        patterns = getattr(redactor, 'patterns', None)
+    return patterns is not None and len(patterns) == 0
+
 def apply_redaction(content: str, cwd: str) -> tuple:
     """Apply redaction using shared Redactor. Returns (redacted_content, count)."""
-    redactor = create_redactor(cwd)
+    redactor = _get_redactor(cwd, _config_mtime_signature(cwd))
+    if _redaction_inert(redactor):
+        return content, 0
     return redactor.redact(content)
 
+_STREAM_CHUNK = 1 << 20  # read size; content never sits fully in memory
+_STREAM_CARRY = 4096     # max tail carried across chunk boundaries for redaction
+
+def _stream_save(src, out_path, redactor) -> tuple:
+    """
+    Stream src (a binary file object) through the redactor into out_path.
+
+    Reads fixed-size chunks and writes to a temp file that is renamed into
+    place, so multi-MB pastes use bounded memory. The text after the last
+    newline in each chunk (up to _STREAM_CARRY chars) is carried into the
+    next chunk so redaction patterns spanning a read boundary still match;
+    patterns spanning more than one chunk will not.
+
+    Returns (byte_count, line_count, redact_count, nonempty). When the
+    content is empty/whitespace-only the temp file is removed, nothing is
+    written to out_path and nonempty is False.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    inert = _redaction_inert(redactor)
+    byte_count = 0
+    line_count = 0
+    redact_count = 0
+    nonempty = False
+    ends_nl = True
+    carry = ''
+    try:
+        with open(tmp_path, 'wb') as out:
+            while True:
+                raw = src.read(_STREAM_CHUNK)
+                text = carry + decoder.decode(raw, final=not raw)
+                carry = ''
+                if raw:
+                    # Hold back the last partial line so the next chunk can
+                    # complete any pattern straddling the boundary
+                    cut = text.rfind('\n', max(0, len(text) - _STREAM_CARRY))
+                    if cut >= 0:
+                        carry = text[cut + 1:]
+                        text = text[:cut + 1]
+                    elif len(text) <= _STREAM_CHUNK:
+                        carry = text
+                        text = ''
+                    # else: one enormous line - process it as-is
+                if text:
+                    if not nonempty and text.strip():
+                        nonempty = True
+                    if not inert:
+                        text, n = redactor.redact(text)
+                        redact_count += n
+                    data = text.encode('utf-8')
+                    out.write(data)
+                    byte_count += len(data)
+                    line_count += data.count(b'\n')
+                    ends_nl = data.endswith(b'\n')
+                if not raw:
+                    break
+        if not nonempty:
+            os.unlink(tmp_path)
+            return 0, 0, 0, False
+        if byte_count and not ends_nl:
+            line_count += 1
+        os.replace(tmp_path, out_path)
+        return byte_count, line_count, redact_count, True
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def format_size(byte_count: int) -> str:
     """Format byte count as human-readable string."""
     if byte_count >= 1048576:
@@ -202,12 +348,50 @@ def format_size(byte_count: int) -> str:
     else:
         return f"{byte_count}B"
 
+# Open fd reused across appends when FEWWORD_BATCH=1 (path, fd)
+_batch_fd = None
+
+def _close_batch_fd():
+    global _batch_fd
+    if _batch_fd is not None:
+        try:
+            os.close(_batch_fd[1])
+        except OSError:
+            pass
+        _batch_fd = None
+
+def _append_manifest(manifest_path, payload: bytes):
+    """
+    Append one manifest record with a single write syscall.
+
+    O_APPEND writes below PIPE_BUF are atomic on POSIX, so concurrent hook
+    processes can't interleave lines. With FEWWORD_BATCH=1 the fd is kept
+    open across calls (closed at exit) for drivers that save many items in
+    one process; the default stays open-write-close.
+    """
+    global _batch_fd
+    if os.environ.get('FEWWORD_BATCH') == '1':
+        path_str = str(manifest_path)
+        if _batch_fd is None or _batch_fd[0] != path_str:
+            _close_batch_fd()
+            import atexit
+            fd = os.open(path_str, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _batch_fd = (path_str, fd)
+            atexit.register(_close_batch_fd)
+        os.write(_batch_fd[1], payload)
+        return
+    fd = os.open(str(manifest_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
 def get_session_id(cwd: str) -> str:
     """Get current session ID from session.json."""
     session_file = Path(cwd) / '.fewword' / 'index' / 'session.json'
     if session_file.exists():
         try:
-            data = json.loads(session_file.read_text())
+            data = _loads(session_file.read_bytes())
             return data.get('session_id', 'unknown')
         except Exception:
             pass
@@ -217,26 +401,22 @@ def main():
     args = sys.argv[1:]
     cwd = get_cwd()
 
-    # Parse arguments
+    # Parse arguments (table-driven: flag -> (default, error noun))
+    value_flags = {
+        '--file': (None, 'a path'),
+        '--source': ('manual', 'a value'),
+    }
+    opts = {flag: default for flag, (default, _) in value_flags.items()}
     title = None
-    file_path = None
-    source = "manual"
 
     i = 0
     while i < len(args):
-        if args[i] == '--file':
+        if args[i] in value_flags:
             if i + 1 < len(args):
-                file_path = args[i + 1]
+                opts[args[i]] = args[i + 1]
                 i += 2
             else:
-                print("Error: --file requires a path")
-                sys.exit(1)
-        elif args[i] == '--source':
-            if i + 1 < len(args):
-                source = args[i + 1]
-                i += 2
-            else:
-                print("Error: --source requires a value")
+                print(f"Error: {args[i]} requires {value_flags[args[i]][1]}")
                 sys.exit(1)
         elif args[i] in ('--help', '-h'):
             print("Usage: /save \"title\" [--file path] [--source hint]")
@@ -258,6 +438,9 @@ def main():
         else:
             i += 1
 
+    file_path = opts['--file']
+    source = opts['--source']
+
     # Validate title
     if not title:
         print("Error: title required")
@@ -269,14 +452,14 @@ def main():
         print("  /save \"Build log\" --file /tmp/build.log")
         sys.exit(1)
 
-    # Read content
+    # Open content source (streamed, never read fully into memory)
     if file_path:
         path = Path(file_path)
         if not path.exists():
             print(f"Error: file not found: {file_path}")
             sys.exit(1)
         try:
-            content = path.read_text(errors='replace')
+            src = open(path, 'rb')
         except Exception as e:
             print(f"Error reading file: {e}")
             sys.exit(1)
@@ -289,23 +472,14 @@ def main():
             print("  echo \"output\" | /save \"title\"")
             print("  /save \"title\" --file /path/to/file")
             sys.exit(1)
-        encoding = sys.stdin.encoding or 'utf-8'
-        content = sys.stdin.buffer.read().decode(encoding, 'replace')
-
-    # Validate content
-    if not content.strip():
-        print("Error: empty content")
-        sys.exit(1)
+        src = sys.stdin.buffer
 
-    # Apply redaction BEFORE saving
-    content, redact_count = apply_redaction(content, cwd)
+    # Generate ID (8-char hex, standard format; cheaper than importing uuid)
+    event_id = os.urandom(4).hex()
 
-    # Generate ID (8-char hex, standard format)
-    event_id = uuid.uuid4().hex[:8]
-
-    # Timestamp
-    now = datetime.now(timezone.utc)
-    ts = now.strftime('%Y%m%d_%H%M%S')
+    # Timestamp (UTC; whole-second precision is all the manifest needs)
+    now = time.gmtime()
+    ts = time.strftime('%Y%m%d_%H%M%S', now)
 
     # Create scratch directory
     scratch_dir = Path(cwd) / '.fewword' / 'scratch' / 'tool_outputs'
@@ -320,16 +494,23 @@ def main():
 
     output_path = scratch_dir / filename
 
-    # Write content
+    # Stream source -> redactor -> file (redaction happens BEFORE anything
+    # lands at the final path)
+    redactor = _get_redactor(cwd, _config_mtime_signature(cwd))
     try:
-        output_path.write_text(content, encoding='utf-8')
+        byte_count, line_count, redact_count, nonempty = _stream_save(
+            src, output_path, redactor)
     except Exception as e:
         print(f"Error writing file: {e}")
         sys.exit(1)
+    finally:
+        if file_path:
+            src.close()
 
-    # Calculate metrics
-    byte_count = len(content.encode('utf-8'))
-    line_count = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+    # Validate content
+    if not nonempty:
+        print("Error: empty content")
+        sys.exit(1)
 
     # Get session ID
     session_id = get_session_id(cwd)
@@ -339,7 +520,7 @@ def main():
         "type": "manual",
         "id": event_id,
         "session_id": session_id,
-        "created_at": now.isoformat().replace('+00:00', 'Z'),
+        "created_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', now),
         "title": title,  # Raw title, json.dumps handles escaping
         "source": source,
         "bytes": byte_count,
@@ -347,13 +528,28 @@ def main():
         "path": f".fewword/scratch/tool_outputs/{filename}"
     }
 
+    # Optionally store a compact failure signature so correlation never has
+    # to re-read this file (opt-in while the extra fields prove themselves)
+    if os.environ.get('FEWWORD_STORE_SIG') == '1':
+        try:
+            from failure_signature import (
+                extract_failure_signature, signature_to_manifest_format)
+            with open(output_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - 65536))
+                tail = f.read().decode('utf-8', 'replace')
+            entry.update(signature_to_manifest_format(
+                extract_failure_signature(tail)))
+        except Exception:
+            pass
+
     # Append to manifest
     manifest_path = Path(cwd) / '.fewword' / 'index' / 'tool_outputs.jsonl'
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(manifest_path, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        _append_manifest(manifest_path, _dumps(entry) + b'\n')
     except Exception as e:
         print(f"Error writing manifest: {e}")
         sys.exit(1)
@@ -14,12 +14,28 @@ Key design decisions:
 
 from __future__ import annotations
 
+import heapq
 import json
 import os
-from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
+# orjson is optional but several times faster at decoding manifest lines
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    # Hoisted decoder: json.loads re-dispatches through the default decoder
+    # plus kwarg handling on every call
+    _json_decode = json.JSONDecoder().decode
+
+    def _loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'replace')
+        return _json_decode(data)
+
 # Import failure signature module
 try:
     from failure_signature import (
@@ -32,17 +48,50 @@ except ImportError:
     import re
     import hashlib
 
+    # xxhash is optional and much faster than sha256 for these non-crypto
+    # fingerprints; either way the hash is 8 hex chars and only compared
+    # against values computed in the same process
+    try:
+        import xxhash
+
+        def _tail_hash(data: bytes) -> str:
+            return xxhash.xxh64(data).hexdigest()[:8]
+    except ImportError:
+        def _tail_hash(data: bytes) -> str:
+            return hashlib.sha256(data).hexdigest()[:8]
+
+    # Compiled once at import - these run per line/candidate in hot loops
+    _ERROR_RE = re.compile(r'(\w+Error):')
+    _TEST_FILE_RE = re.compile(r'(test_\w+\.py)')
+    _DIGITS_RE = re.compile(r'\d+')
+
+    def _top_k_unique(pattern, content: str, k: int) -> List[str]:
+        """
+        First k distinct matches in document order, sorted.
+
+        Unlike sorted(set(findall(...)))[:k] this stops scanning once k
+        unique values are seen, so a huge output with repeated errors
+        doesn't get walked end to end. When more than k distinct values
+        exist, the k found earliest win (rather than the k smallest).
+        """
+        seen = set()
+        for m in pattern.finditer(content):
+            seen.add(m.group(1))
+            if len(seen) >= k:
+                break
+        return sorted(seen)
+
     def extract_failure_signature(content: str, cmd_group: Optional[str] = None) -> Dict:
         if not content:
             return {}
 
-        # P2 fix #10: Use sorted(set(...)) for deterministic output
-        error_types = sorted(set(re.findall(r'(\w+Error):', content)))[:3]
-        test_files = sorted(set(re.findall(r'(test_\w+\.py)', content)))[:5]
+        # P2 fix #10: sorted for deterministic output
+        error_types = _top_k_unique(_ERROR_RE, content, 3)
+        test_files = _top_k_unique(_TEST_FILE_RE, content, 5)
 
         lines = [l.strip() for l in content.split('\n') if l.strip()][-10:]
-        normalized = [re.sub(r'\d+', 'N', l) for l in lines]
-        tail_hash = hashlib.sha256('\n'.join(normalized).encode()).hexdigest()[:8]
+        normalized = [_DIGITS_RE.sub('N', l) for l in lines]
+        tail_hash = _tail_hash('\n'.join(normalized).encode())
 
         return {
             'error_types': error_types,
@@ -90,6 +139,37 @@ SIMILARITY_THRESHOLD = 0.3  # Minimum score to consider related
 MAX_CANDIDATES = 50  # Max failures to scan
 MAX_RESULTS = 5  # Max correlations to return
 
+# Manifest location relative to cwd (os.path.join is much cheaper than
+# chaining Path objects in per-entry loops)
+_MANIFEST_REL = os.path.join('.fewword', 'index', 'tool_outputs.jsonl')
+
+
+def _iter_lines_reverse(path, blocksize: int = 65536):
+    """
+    Yield manifest lines last-to-first, reading fixed-size blocks from EOF.
+
+    Recent entries live at the end of the manifest, so scanning backwards
+    lets callers stop after `limit` matches instead of parsing the whole
+    history.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        carry = b''
+        while pos > 0:
+            read_size = min(blocksize, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size) + carry
+            lines = block.split(b'\n')
+            # First piece may be a partial line continued in the next block
+            carry = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if carry.strip():
+            yield carry
+
 
 def get_manifest_failures(
     cwd: str,
@@ -109,44 +189,45 @@ def get_manifest_failures(
     Returns:
         List of manifest entries (most recent first)
     """
-    manifest_path = Path(cwd) / '.fewword' / 'index' / 'tool_outputs.jsonl'
+    manifest_path = os.path.join(cwd, _MANIFEST_REL)
     failures = []
 
-    if not manifest_path.exists():
-        return failures
-
+    # Scan newest-first so we can stop at `limit` instead of parsing the
+    # full history (matches live at the tail of an append-only manifest)
     try:
-        with open(manifest_path, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-
-                    # Only offload entries
-                    if entry.get('type') != 'offload':
-                        continue
-
-                    # Only failures
-                    if entry.get('exit_code', 0) == 0:
-                        continue
-
-                    # Exclude specified ID
-                    if exclude_id and entry.get('id', '').upper() == exclude_id.upper():
+        for line in _iter_lines_reverse(manifest_path):
+            try:
+                entry = _loads(line)
+
+                # Only offload entries
+                if entry.get('type') != 'offload':
+                    continue
+
+                # Only failures
+                if entry.get('exit_code', 0) == 0:
+                    continue
+
+                # Exclude specified ID
+                if exclude_id and entry.get('id', '').upper() == exclude_id.upper():
+                    continue
+
+                # Filter by cmd_group
+                if cmd_group:
+                    entry_group = entry.get('cmd_group') or entry.get('cmd')
+                    if entry_group != cmd_group:
                         continue
 
-                    # Filter by cmd_group
-                    if cmd_group:
-                        entry_group = entry.get('cmd_group') or entry.get('cmd')
-                        if entry_group != cmd_group:
-                            continue
-
-                    failures.append(entry)
-                except json.JSONDecodeError:
-                    pass
+                failures.append(entry)
+                if len(failures) >= limit:
+                    break
+            except ValueError:
+                # Covers json.JSONDecodeError and orjson.JSONDecodeError
+                pass
     except Exception:
         pass
 
-    # Return most recent first, limited
-    return list(reversed(failures))[:limit]
+    # Already most recent first
+    return failures
 
 
 def get_entry_signature(entry: Dict, cwd: str) -> Optional[Dict]:
@@ -175,23 +256,90 @@ def get_entry_signature(entry: Dict, cwd: str) -> Optional[Dict]:
             'tail_hash': entry.get('th', '')
         }
 
-    # Compute from file
+    # Compute from file (one stat doubles as the existence check and the
+    # cache key ingredient)
     path_str = entry.get('path')
     if not path_str:
         return None
-    path = Path(cwd) / path_str
-    if not path.is_file():
+    path = os.path.join(cwd, path_str)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
         return None
 
+    cmd_group = entry.get('cmd_group') or entry.get('cmd')
+    return _sig_for_path(path, mtime_ns, cmd_group)
+
+
+_TAIL_BYTES = 65536  # error summaries and tracebacks live at the end of output
+
+
+def _read_tail(path_str: str, n: int = _TAIL_BYTES) -> str:
+    """Read at most the last n bytes of a file, aligned to a line start."""
+    with open(path_str, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - n))
+        data = f.read()
+    if size > n:
+        # Drop the likely-partial first line
+        nl = data.find(b'\n')
+        if nl >= 0:
+            data = data[nl + 1:]
+    return data.decode('utf-8', 'replace')
+
+
+@lru_cache(maxsize=128)
+def _sig_for_path(path_str: str, _mtime_ns: int, cmd_group: Optional[str]) -> Optional[Dict]:
+    """
+    Compute a failure signature from a file, cached per (path, mtime).
+
+    The same output file shows up repeatedly when scoring candidates and
+    clustering in one process; the mtime key makes edits invalidate the
+    cache. Only the last _TAIL_BYTES are read - that is where failure
+    summaries land, and the tail hash only looks at the last 10 lines
+    anyway. Callers must not mutate the returned dict.
+    """
     try:
-        # P2 fix #11: Add explicit encoding to prevent platform-dependent failures
-        content = path.read_text(encoding='utf-8', errors='replace')
-        cmd_group = entry.get('cmd_group') or entry.get('cmd')
-        return extract_failure_signature(content, cmd_group)
+        return extract_failure_signature(_read_tail(path_str), cmd_group)
     except Exception:
         return None
 
 
+def _sig_sets(sig: Dict) -> tuple:
+    """
+    (errors, files, tail_hash) for a signature, with the sets built once.
+
+    compute_similarity rebuilds four sets per call; in the scoring loop the
+    current signature's sets were reconstructed for every candidate. The
+    tuple is cached on the sig dict itself (sigs aren't hashable for
+    lru_cache), so cached signatures keep their sets across calls too.
+    """
+    cached = sig.get('_sets')
+    if cached is None:
+        cached = (
+            frozenset(sig.get('error_types', []) or sig.get('err', []) or []),
+            frozenset(sig.get('test_files', []) or sig.get('tst', []) or []),
+            sig.get('tail_hash') or sig.get('th'),
+        )
+        sig['_sets'] = cached
+    return cached
+
+
+def _similarity(sets1: tuple, sets2: tuple) -> float:
+    """compute_similarity over precomputed _sig_sets tuples - same weights."""
+    errors1, files1, hash1 = sets1
+    errors2, files2, hash2 = sets2
+    score = 0.0
+    if errors1 and errors2:
+        score += 0.3 * len(errors1 & errors2) / max(len(errors1), len(errors2))
+    if files1 and files2:
+        score += 0.4 * len(files1 & files2) / max(len(files1), len(files2))
+    if hash1 and hash2 and hash1 == hash2:
+        score += 0.3
+    return score
+
+
 def find_correlations(
     current_entry: Dict,
     cwd: str,
@@ -230,25 +378,30 @@ def find_correlations(
         limit=MAX_CANDIDATES
     )
 
-    # Score each candidate
-    matches = []
-    for entry in candidates:
+    # Score each candidate, keeping only the top max_results in a bounded
+    # heap; -seq breaks score ties toward more recent entries (matching the
+    # old stable sort). Explanation strings are built only for the winners.
+    current_sets = _sig_sets(current_sig)
+    top = []
+    for seq, entry in enumerate(candidates):
         entry_sig = get_entry_signature(entry, cwd)
         if not entry_sig:
             continue
 
-        score = compute_similarity(current_sig, entry_sig)
+        score = _similarity(current_sets, _sig_sets(entry_sig))
         if score >= threshold:
-            matches.append({
-                'entry': entry,
-                'score': score,
-                'reason': explain_similarity(current_sig, entry_sig)
-            })
-
-    # Sort by score descending
-    matches.sort(key=lambda x: -x['score'])
+            item = (score, -seq, entry, entry_sig)
+            if len(top) < max_results:
+                heapq.heappush(top, item)
+            elif item > top[0]:
+                heapq.heapreplace(top, item)
 
-    return matches[:max_results]
+    top.sort(key=lambda x: (-x[0], -x[1]))
+    return [{
+        'entry': entry,
+        'score': score,
+        'reason': explain_similarity(current_sig, entry_sig)
+    } for score, _neg_seq, entry, entry_sig in top]
 
 
 def cluster_failures(
@@ -329,21 +482,21 @@ def main():
         entry_id = sys.argv[2].upper()
 
         # Find entry (P2 fix: add file read error handling)
-        manifest_path = Path(cwd) / '.fewword' / 'index' / 'tool_outputs.jsonl'
+        manifest_path = os.path.join(cwd, _MANIFEST_REL)
         entry = None
 
-        if not manifest_path.exists():
+        if not os.path.exists(manifest_path):
             print(f"Error: Manifest file not found at {manifest_path}")
             sys.exit(1)
 
         try:
-            with open(manifest_path, 'r') as f:
+            with open(manifest_path, 'rb') as f:
                 for line in f:
                     try:
-                        e = json.loads(line)
+                        e = _loads(line)
                         if e.get('id', '').upper() == entry_id:
                             entry = e
-                    except (json.JSONDecodeError, KeyError, TypeError):
+                    except (ValueError, KeyError, TypeError):
                         pass
         except (IOError, OSError) as err:
             print(f"Error reading manifest: {err}")
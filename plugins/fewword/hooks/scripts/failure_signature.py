@@ -20,7 +20,16 @@ from __future__ import annotations
 
 import re
 import hashlib
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+# google-re2 is optional: it executes the fused alternations as a linear-
+# time DFA, immune to backtracking blowups on pathological log lines. The
+# pyre2 module mirrors the re API (finditer/groups) for the subset we use.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
 
 
 # Error patterns by language/framework
@@ -73,6 +82,43 @@ TEST_FILE_PATTERNS = [
 ]
 
 
+def _combine_patterns(patterns):
+    """
+    Fuse a pattern list into one compiled alternation.
+
+    Pure-literal patterns get wrapped in a group so every alternative
+    captures the value the old per-pattern findall loop extracted (the
+    first group of whichever alternative matched). Duplicate patterns
+    (e.g. the python/js '\\w+Error:' twins) are folded. Compiled with re2
+    when available (one O(n) DFA pass), stdlib re otherwise.
+    """
+    seen = set()
+    parts = []
+    for pat in patterns:
+        if pat in seen:
+            continue
+        seen.add(pat)
+        parts.append(pat if '(' in pat else f'({pat})')
+    joined = '|'.join(parts)
+    if _re2 is not None:
+        try:
+            return _re2.compile(joined)
+        except Exception:
+            pass  # pattern outside re2's subset - use the backtracking engine
+    return re.compile(joined)
+
+
+# One compiled scan instead of one findall pass per pattern - on MB-sized
+# logs this cuts text traversals by the pattern count
+_ERROR_RE = _combine_patterns(pat for pat, _ in ERROR_PATTERNS)
+_TEST_FILE_RE = _combine_patterns(TEST_FILE_PATTERNS)
+
+
+def _first_group(m: re.Match) -> str:
+    """The captured value of whichever alternative matched."""
+    return next((g for g in m.groups() if g is not None), m.group(0))
+
+
 def extract_error_types(content: str, max_count: int = 3) -> List[str]:
     """
     Extract unique error type names from output.
@@ -87,20 +133,14 @@ def extract_error_types(content: str, max_count: int = 3) -> List[str]:
     errors = []
     seen = set()
 
-    for pattern, _ in ERROR_PATTERNS:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            # Normalize: strip whitespace, take first part if tuple
-            if isinstance(match, tuple):
-                match = match[0]
-            match = match.strip()
+    for m in _ERROR_RE.finditer(content):
+        match = _first_group(m).strip()
+        if match and match not in seen:
+            seen.add(match)
+            errors.append(match)
 
-            if match and match not in seen:
-                seen.add(match)
-                errors.append(match)
-
-                if len(errors) >= max_count:
-                    return errors
+            if len(errors) >= max_count:
+                break
 
     return errors
 
@@ -119,23 +159,45 @@ def extract_test_files(content: str, max_count: int = 5) -> List[str]:
     files = []
     seen = set()
 
-    for pattern in TEST_FILE_PATTERNS:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            # Normalize: take basename only
-            if '/' in match:
-                match = match.split('/')[-1]
+    for m in _TEST_FILE_RE.finditer(content):
+        # Normalize: take basename only (rpartition returns the whole
+        # string unchanged when there's no '/')
+        match = _first_group(m).rpartition('/')[2]
 
-            if match and match not in seen:
-                seen.add(match)
-                files.append(match)
+        if match and match not in seen:
+            seen.add(match)
+            files.append(match)
 
-                if len(files) >= max_count:
-                    return files
+            if len(files) >= max_count:
+                break
 
     return files
 
 
+# Tail normalization patterns, compiled once. _NORM_RE does the
+# numbers->N replacement and whitespace collapse in a single pass.
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+_NORM_RE = re.compile(r'(\d+)|\s+')
+
+
+def _norm_repl(m: re.Match) -> str:
+    return 'N' if m.group(1) else ' '
+
+
+# The tail hash is an opaque 8-hex fingerprint for fuzzy matching, not a
+# cryptographic digest - use the fastest hash on hand. xxh64 when the
+# optional xxhash package is installed, else blake2b with a 4-byte digest
+# (exactly 8 hex chars, and quicker than md5).
+try:
+    import xxhash
+
+    def _new_tail_hasher():
+        return xxhash.xxh64()
+except ImportError:
+    def _new_tail_hasher():
+        return hashlib.blake2b(digest_size=4)
+
+
 def compute_tail_hash(content: str, num_lines: int = 10) -> str:
     """
     Compute hash of normalized last N lines.
@@ -153,39 +215,53 @@ def compute_tail_hash(content: str, num_lines: int = 10) -> str:
     Returns:
         8-character hex hash of normalized tail
     """
-    lines = content.split('\n')
-
-    # Get last N non-empty lines
+    # Collect the last N non-empty lines by scanning backwards from the
+    # end - split('\n') would materialize every line of a multi-MB log
+    # just to throw all but the tail away
     tail_lines = []
-    for line in reversed(lines):
-        line = line.strip()
+    end = len(content)
+    while end > 0 and len(tail_lines) < num_lines:
+        start = content.rfind('\n', 0, end)
+        line = content[start + 1:end].strip()
         if line:
             tail_lines.append(line)
-            if len(tail_lines) >= num_lines:
-                break
+        end = start
 
     tail_lines.reverse()
 
-    # Normalize each line
-    normalized = []
+    # Normalize each line (numbers -> N and whitespace collapse fused into
+    # one pass; patterns compiled once at module scope) and feed the hasher
+    # incrementally - no joined str/bytes copy of the tail
+    h = _new_tail_hasher()
+    first = True
     for line in tail_lines:
-        # Strip ANSI codes
-        line = re.sub(r'\x1b\[[0-9;]*m', '', line)
-        # Replace numbers with N
-        line = re.sub(r'\d+', 'N', line)
-        # Collapse whitespace
-        line = re.sub(r'\s+', ' ', line)
-        normalized.append(line)
+        line = _ANSI_RE.sub('', line)
+        line = _NORM_RE.sub(_norm_repl, line)
+        if not first:
+            h.update(b'\n')
+        first = False
+        h.update(line.encode())
+
+    return h.hexdigest()[:8]
 
-    # Hash the normalized content
-    content_hash = hashlib.md5('\n'.join(normalized).encode()).hexdigest()
-    return content_hash[:8]
+
+# Scan caps for pattern extraction. Errors concentrate in the head (build
+# and setup failures) and the tail (test summary, final traceback); the
+# middle of a multi-MB log rarely adds signal the signature's small
+# max_counts would keep anyway.
+_SCAN_HEAD = 64 * 1024
+_SCAN_TAIL = 256 * 1024
 
 
 def extract_failure_signature(content: str, cmd_group: Optional[str] = None) -> Dict:
     """
     Extract complete failure signature from command output.
 
+    Pattern extraction scans at most the first 64KB plus the last 256KB
+    of content, bounding work regardless of output size - the signature
+    is intentionally lossy already. The tail hash always uses the true
+    last lines.
+
     Args:
         content: Command output text
         cmd_group: Optional command group for context-aware extraction
@@ -196,9 +272,16 @@ def extract_failure_signature(content: str, cmd_group: Optional[str] = None) ->
     if not content:
         return {}
 
+    if len(content) > _SCAN_HEAD + _SCAN_TAIL:
+        # '\n...\n' keeps the seam from splicing two partial lines into a
+        # spurious match
+        scan = content[:_SCAN_HEAD] + '\n...\n' + content[-_SCAN_TAIL:]
+    else:
+        scan = content
+
     return {
-        'error_types': extract_error_types(content),
-        'test_files': extract_test_files(content),
+        'error_types': extract_error_types(scan),
+        'test_files': extract_test_files(scan),
         'tail_hash': compute_tail_hash(content)
     }
 
@@ -231,6 +314,72 @@ def signature_to_manifest_format(signature: Dict) -> Dict:
     return compact
 
 
+class Sig(NamedTuple):
+    """
+    Compact in-memory form of a signature.
+
+    A NamedTuple of frozensets costs a fraction of the stored dict form,
+    which matters when bulk callers hold thousands of manifest entries at
+    once. Unpacks positionally, so it is a drop-in for the plain tuples
+    prepare_signature used to return.
+    """
+    errors: frozenset
+    files: frozenset
+    tail_hash: Optional[str]
+
+
+_EMPTY_SIG = Sig(frozenset(), frozenset(), None)
+
+
+def prepare_signature(sig: Dict) -> Sig:
+    """
+    Build a Sig (errors, files, tail_hash) view of a signature dict.
+
+    Correlation compares one query signature against many stored ones;
+    preparing each side once means N comparisons build N set views
+    instead of 4N throwaway sets. Error types and file names repeat
+    heavily across entries, so they're interned: duplicates share one
+    str object and set intersections hit the pointer-equality fast path.
+    Accepts both full and compact (err/tst/th) key names.
+    """
+    if not sig:
+        return _EMPTY_SIG
+    tail_hash = sig.get('tail_hash') or sig.get('th')
+    return Sig(
+        frozenset(map(sys.intern,
+                      sig.get('error_types') or sig.get('err') or ())),
+        frozenset(map(sys.intern,
+                      sig.get('test_files') or sig.get('tst') or ())),
+        sys.intern(tail_hash) if tail_hash else None,
+    )
+
+
+# Public name for callers loading manifest entries in bulk
+load_sig = prepare_signature
+
+
+def compute_similarity_prepared(prep1: Sig, prep2: Sig) -> float:
+    """compute_similarity over prepare_signature views - same weights."""
+    errors1, files1, hash1 = prep1
+    errors2, files2, hash2 = prep2
+
+    score = 0.0
+
+    # Error types overlap (30%)
+    if errors1 and errors2:
+        score += 0.3 * len(errors1 & errors2) / max(len(errors1), len(errors2))
+
+    # Test files overlap (40%)
+    if files1 and files2:
+        score += 0.4 * len(files1 & files2) / max(len(files1), len(files2))
+
+    # Tail hash match (30%)
+    if hash1 and hash2 and hash1 == hash2:
+        score += 0.3
+
+    return score
+
+
 def compute_similarity(sig1: Dict, sig2: Dict) -> float:
     """
     Compute similarity score between two failure signatures.
@@ -240,6 +389,10 @@ def compute_similarity(sig1: Dict, sig2: Dict) -> float:
     - Test files overlap: 40%
     - Tail hash match: 30%
 
+    Convenience wrapper over prepare_signature/compute_similarity_prepared;
+    callers scoring one signature against many should prepare each side
+    once and use compute_similarity_prepared directly.
+
     Args:
         sig1: First signature
         sig2: Second signature
@@ -250,31 +403,72 @@ def compute_similarity(sig1: Dict, sig2: Dict) -> float:
     if not sig1 or not sig2:
         return 0.0
 
-    score = 0.0
+    return compute_similarity_prepared(
+        prepare_signature(sig1), prepare_signature(sig2))
 
-    # Error types overlap (30%)
-    errors1 = set(sig1.get('error_types', []) or sig1.get('err', []) or [])
-    errors2 = set(sig2.get('error_types', []) or sig2.get('err', []) or [])
-    if errors1 and errors2:
-        overlap = len(errors1 & errors2)
-        max_len = max(len(errors1), len(errors2))
-        score += 0.3 * (overlap / max_len)
 
-    # Test files overlap (40%)
-    files1 = set(sig1.get('test_files', []) or sig1.get('tst', []) or [])
-    files2 = set(sig2.get('test_files', []) or sig2.get('tst', []) or [])
-    if files1 and files2:
-        overlap = len(files1 & files2)
-        max_len = max(len(files1), len(files2))
-        score += 0.4 * (overlap / max_len)
+class SignatureIndex:
+    """
+    Inverted index over failure signatures for sub-linear candidate lookup.
 
-    # Tail hash match (30%)
-    hash1 = sig1.get('tail_hash') or sig1.get('th')
-    hash2 = sig2.get('tail_hash') or sig2.get('th')
-    if hash1 and hash2 and hash1 == hash2:
-        score += 0.3
+    Maps each error type, test file, and tail hash to the set of entry ids
+    whose signature contains it. Finding correlation candidates for a
+    query is then a union of a handful of posting lists instead of a scan
+    over every stored signature - worthwhile for bulk callers (clustering,
+    batch correlation) that hold many signatures in one process.
+    """
 
-    return score
+    def __init__(self):
+        self._by_error: Dict[str, set] = {}
+        self._by_file: Dict[str, set] = {}
+        self._by_hash: Dict[str, set] = {}
+        self._prepped: Dict = {}
+
+    def add(self, entry_id, sig: Dict):
+        """Index one signature under its entry id."""
+        prep = prepare_signature(sig)
+        self._prepped[entry_id] = prep
+        errors, files, tail_hash = prep
+        for error in errors:
+            self._by_error.setdefault(error, set()).add(entry_id)
+        for name in files:
+            self._by_file.setdefault(name, set()).add(entry_id)
+        if tail_hash:
+            self._by_hash.setdefault(tail_hash, set()).add(entry_id)
+
+    def __len__(self):
+        return len(self._prepped)
+
+    def _candidates(self, prep: Sig) -> set:
+        errors, files, tail_hash = prep
+        out = set()
+        for error in errors:
+            out.update(self._by_error.get(error, ()))
+        for name in files:
+            out.update(self._by_file.get(name, ()))
+        if tail_hash:
+            out.update(self._by_hash.get(tail_hash, ()))
+        return out
+
+    def candidates(self, sig: Dict) -> set:
+        """Entry ids sharing at least one feature with sig."""
+        return self._candidates(prepare_signature(sig))
+
+    def correlate(self, sig: Dict, threshold: float = 0.3) -> List[tuple]:
+        """
+        Score sig against indexed candidates only.
+
+        Returns [(entry_id, score)] for candidates at or above threshold,
+        best first.
+        """
+        prep = prepare_signature(sig)
+        results = []
+        for entry_id in self._candidates(prep):
+            score = compute_similarity_prepared(prep, self._prepped[entry_id])
+            if score >= threshold:
+                results.append((entry_id, score))
+        results.sort(key=lambda item: -item[1])
+        return results
 
 
 def explain_similarity(sig1: Dict, sig2: Dict) -> str:
@@ -25,32 +25,78 @@ from __future__ import annotations
 
 import gzip
 import json
+import mmap
 import os
 import shutil
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Generator
 
+# orjson is optional but several times faster per line - the decode loop is
+# the dominant CPU cost of read-all on a large manifest
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    # Hoisted decoder: json.loads re-dispatches through the default decoder
+    # plus kwarg handling on every call
+    _json_decode = json.JSONDecoder().decode
+
+    def _loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', 'replace')
+        return _json_decode(data)
+
+# zstandard is optional: ~10x faster compression than gzip at a better
+# ratio. Selected via FEWWORD_COMPRESSION=zstd; gzip stays the portable
+# default and .zst files always decompress when the package is present.
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 
 def get_cwd():
     """Get current working directory from env or os."""
     return os.environ.get('FEWWORD_CWD', os.getcwd())
 
 
+@lru_cache(maxsize=8)
+def _index_dir(cwd: str) -> Path:
+    """Memoized .fewword/index dir - the Path is rebuilt on every call
+    otherwise, and hooks resolve it several times per invocation."""
+    return Path(cwd) / '.fewword' / 'index'
+
+
 def get_manifest_path(cwd: str) -> Path:
     """Get path to main manifest file."""
-    return Path(cwd) / '.fewword' / 'index' / 'tool_outputs.jsonl'
+    return _index_dir(cwd) / 'tool_outputs.jsonl'
 
 
 def get_rotated_manifests(cwd: str) -> List[Path]:
     """Get list of rotated manifest files, sorted newest first."""
-    index_dir = Path(cwd) / '.fewword' / 'index'
+    index_dir = _index_dir(cwd)
     if not index_dir.exists():
         return []
 
-    # Find all rotated manifests (tool_outputs_YYYY-MM.jsonl)
-    rotated = list(index_dir.glob('tool_outputs_*.jsonl'))
+    # Find all rotated manifests (tool_outputs_YYYY-MM.jsonl). scandir beats
+    # glob here: no pattern compilation and one syscall batch for the listing
+    rotated = []
+    with os.scandir(index_dir) as it:
+        for entry in it:
+            name = entry.name
+            if (name.startswith('tool_outputs_') and name.endswith('.jsonl')
+                    and entry.is_file()):
+                rotated.append(index_dir / name)
     # Sort by name descending (newest first)
     rotated.sort(reverse=True)
     return rotated
@@ -83,21 +129,44 @@ def rotate_manifest(cwd: str, keep_rotated: int = 5) -> Optional[str]:
     # Generate rotated filename with year-month
     timestamp = datetime.now().strftime('%Y-%m')
     index_dir = manifest.parent
-    rotated_name = f'tool_outputs_{timestamp}.jsonl'
-    rotated_path = index_dir / rotated_name
 
-    # If same month rotation exists, append a counter
-    counter = 1
-    while rotated_path.exists():
-        rotated_name = f'tool_outputs_{timestamp}_{counter}.jsonl'
-        rotated_path = index_dir / rotated_name
-        counter += 1
+    def _name_for(counter: int) -> Path:
+        if counter == 0:
+            return index_dir / f'tool_outputs_{timestamp}.jsonl'
+        return index_dir / f'tool_outputs_{timestamp}_{counter}.jsonl'
+
+    # A per-month counter hint makes picking the next name O(1); without
+    # it, a month with k prior rotations costs k existence probes
+    ctr_path = index_dir / f'.rotctr_{timestamp}'
+    try:
+        counter = int(ctr_path.read_text())
+        rotated_path = _name_for(counter)
+        if rotated_path.exists():
+            # Stale hint - fall through to probing
+            counter = -1
+    except (OSError, ValueError):
+        counter = -1
+
+    if counter < 0:
+        counter = 0
+        rotated_path = _name_for(counter)
+        while rotated_path.exists():
+            counter += 1
+            rotated_path = _name_for(counter)
+
+    try:
+        ctr_path.write_text(str(counter + 1))
+    except OSError:
+        pass
 
-    # Move current to rotated
-    shutil.move(str(manifest), str(rotated_path))
+    # Move current to rotated. os.replace is a pure atomic rename (both
+    # paths live in the same directory), where shutil.move adds copy
+    # fallback machinery we never need here
+    os.replace(manifest, rotated_path)
 
-    # Create fresh manifest
-    manifest.touch()
+    # Recreate the manifest immediately so concurrent appenders see a
+    # missing file for as short a window as possible
+    os.close(os.open(manifest, os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC, 0o644))
 
     # Cleanup old rotated manifests
     cleanup_old_rotated(cwd, keep_rotated)
@@ -117,11 +186,71 @@ def cleanup_old_rotated(cwd: str, keep: int = 5):
             pass
 
 
-def read_all_manifests(cwd: str, limit: int = 1000) -> Generator[Dict, None, None]:
+def _reverse_lines_blocks(f, block: int = 65536) -> Generator[bytes, None, None]:
+    """Yield non-empty lines last-to-first by reading blocks backwards.
+
+    Fallback for filesystems that reject mmap (FUSE/network mounts);
+    keeps memory at O(block) and preserves the early-exit behavior.
+    """
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    carry = b''
+    while pos > 0:
+        read_size = min(block, pos)
+        pos -= read_size
+        f.seek(pos)
+        chunk = f.read(read_size) + carry
+        parts = chunk.split(b'\n')
+        # First piece may be a partial line continued in the next block
+        carry = parts[0]
+        for line in reversed(parts[1:]):
+            if line.strip():
+                yield line
+    if carry.strip():
+        yield carry
+
+
+def _reverse_lines(path) -> Generator[bytes, None, None]:
+    """
+    Yield non-empty lines of a file last-to-first.
+
+    Memory-maps the file and walks newline positions backwards with
+    rfind, so scanning is zero-copy against the page cache: only the
+    lines actually yielded are materialized as bytes, and serving a
+    typical limit from the manifest tail touches a few pages instead of
+    loading the whole file. Falls back to backward block reads where
+    mmap is unavailable.
+    """
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file (mmap rejects length 0) - nothing to yield
+            return
+        except OSError:
+            # mmap unavailable (e.g. some network filesystems): read blocks
+            yield from _reverse_lines_blocks(f)
+            return
+        with buf:
+            end = len(buf)
+            while end > 0:
+                nl = buf.rfind(b'\n', 0, end)
+                line = buf[nl + 1:end]
+                if line.strip():
+                    yield line
+                end = nl
+
+
+def read_all_manifests(cwd: str, limit: int = 1000,
+                       raw: bool = False) -> Generator[Dict, None, None]:
     """
     Read entries from all manifests (current + rotated).
 
-    Yields entries newest first, up to limit.
+    Yields entries newest first, up to limit. With raw=True, yields the
+    original JSONL line bytes instead of parsed dicts - callers that just
+    re-serialize (like the read-all CLI) skip the decode+encode round-trip
+    entirely. Raw mode filters on a cheap shape check ({...}) rather than
+    a full parse.
     """
     manifest = get_manifest_path(cwd)
     rotated = get_rotated_manifests(cwd)
@@ -130,46 +259,56 @@ def read_all_manifests(cwd: str, limit: int = 1000) -> Generator[Dict, None, Non
 
     # Read from current manifest first (newest)
     if manifest.exists():
-        lines = manifest.read_text().strip().split('\n')
-        for line in reversed(lines):
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                yield entry
-                count += 1
-                if count >= limit:
-                    return
-            except json.JSONDecodeError:
-                pass
+        for line in _reverse_lines(manifest):
+            if raw:
+                stripped = line.strip()
+                if not (stripped.startswith(b'{') and stripped.endswith(b'}')):
+                    continue
+                entry = stripped
+            else:
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    # Covers json.JSONDecodeError and orjson.JSONDecodeError
+                    continue
+            yield entry
+            count += 1
+            if count >= limit:
+                return
 
     # Then read from rotated manifests (newest to oldest)
     for rotated_manifest in rotated:
         try:
-            lines = rotated_manifest.read_text().strip().split('\n')
-            for line in reversed(lines):
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    yield entry
-                    count += 1
-                    if count >= limit:
-                        return
-                except json.JSONDecodeError:
-                    pass
+            for line in _reverse_lines(rotated_manifest):
+                if raw:
+                    stripped = line.strip()
+                    if not (stripped.startswith(b'{') and stripped.endswith(b'}')):
+                        continue
+                    entry = stripped
+                else:
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        continue
+                yield entry
+                count += 1
+                if count >= limit:
+                    return
         except Exception:
             pass
 
 
-def compress_file(file_path: str, min_bytes: int = 1048576, level: int = 6) -> Optional[str]:
+def compress_file(file_path: str, min_bytes: int = 1048576, level: int = 1) -> Optional[str]:
     """
     Compress a file with gzip if it exceeds min_bytes.
 
     Args:
         file_path: Path to file to compress
         min_bytes: Minimum size to trigger compression
-        level: Gzip compression level (1-9)
+        level: Gzip compression level (1-9). Defaults to 1: for cold
+            scratch files throughput matters more than ratio, and level 1
+            compresses ~3x faster than the old default of 6 for roughly
+            10% more output.
 
     Returns:
         Path to compressed file, or None if not compressed
@@ -179,19 +318,27 @@ def compress_file(file_path: str, min_bytes: int = 1048576, level: int = 6) -> O
         return None
 
     # Don't compress if already compressed
-    if path.suffix == '.gz':
+    if path.suffix in ('.gz', '.zst'):
         return None
 
     # Check size threshold
     if path.stat().st_size < min_bytes:
         return None
 
+    # Opt-in zstd path
+    if zstd is not None and os.environ.get('FEWWORD_COMPRESSION') == 'zstd':
+        return compress_file_zstd(str(path), min_bytes)
+
     # Compress
     compressed_path = path.with_suffix(path.suffix + '.gz')
     try:
-        with open(path, 'rb') as f_in:
-            with gzip.open(compressed_path, 'wb', compresslevel=level) as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        # mtime=0 and an empty embedded filename make output deterministic
+        # for identical input; 1MB chunks cut Python-level read/write
+        # round-trips vs copyfileobj's 64KB
+        with open(path, 'rb') as f_in, open(compressed_path, 'wb') as f_raw:
+            with gzip.GzipFile(filename='', fileobj=f_raw, mode='wb',
+                               compresslevel=level, mtime=0) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1 << 20)
 
         # Remove original
         path.unlink()
@@ -203,6 +350,116 @@ def compress_file(file_path: str, min_bytes: int = 1048576, level: int = 6) -> O
         return None
 
 
+# Shared zstd dictionary: CI logs are highly repetitive across runs, and a
+# trained dictionary recovers the cross-file redundancy per-file
+# compression can't see (typically 2-3x better ratio on small files)
+_ZSTD_DICT_REL = os.path.join('.fewword', 'index', 'zstd.dict')
+_zstd_dict_cache: Dict[str, tuple] = {}  # path -> (mtime_ns, dict or None)
+
+
+def _load_zstd_dict(cwd: str):
+    """Load (and cache per mtime) the trained dictionary, if any."""
+    if zstd is None or not cwd:
+        return None
+    dict_path = os.path.join(cwd, _ZSTD_DICT_REL)
+    try:
+        mtime_ns = os.stat(dict_path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _zstd_dict_cache.get(dict_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with open(dict_path, 'rb') as f:
+            loaded = zstd.ZstdCompressionDict(f.read())
+    except Exception:
+        loaded = None
+    _zstd_dict_cache[dict_path] = (mtime_ns, loaded)
+    return loaded
+
+
+def train_zstd_dictionary(cwd: str, max_samples: int = 50,
+                          dict_size: int = 100_000) -> Optional[str]:
+    """
+    Train a shared zstd dictionary from recent scratch outputs.
+
+    Samples up to max_samples uncompressed files (newest first, capped at
+    128KB each) and persists the dictionary to .fewword/index/zstd.dict.
+    Returns the dictionary path, or None when zstandard is missing or
+    there aren't enough samples to train from.
+    """
+    if zstd is None:
+        return None
+
+    scratch_dir = Path(cwd) / '.fewword' / 'scratch' / 'tool_outputs'
+    if not scratch_dir.exists():
+        return None
+
+    candidates = []
+    with os.scandir(scratch_dir) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith(('.gz', '.zst')):
+                candidates.append((entry.stat().st_mtime_ns, entry.path))
+    candidates.sort(reverse=True)
+
+    samples = []
+    for _, sample_path in candidates[:max_samples]:
+        try:
+            with open(sample_path, 'rb') as f:
+                samples.append(f.read(131072))
+        except OSError:
+            continue
+    # zstd training needs a reasonable sample population
+    if len(samples) < 8:
+        return None
+
+    dict_path = Path(cwd) / _ZSTD_DICT_REL
+    try:
+        trained = zstd.train_dictionary(dict_size, samples)
+        dict_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dict_path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_bytes(trained.as_bytes())
+        os.replace(tmp, dict_path)
+        return str(dict_path)
+    except Exception:
+        return None
+
+
+def compress_file_zstd(file_path: str, min_bytes: int = 1048576,
+                       level: int = 3, cwd: Optional[str] = None) -> Optional[str]:
+    """
+    Compress a file with zstd if it exceeds min_bytes.
+
+    Same contract as compress_file but writes <path>.zst. Uses the shared
+    trained dictionary when one exists for cwd (defaults to the env cwd).
+    Returns None when the zstandard package is unavailable.
+    """
+    if zstd is None:
+        return None
+
+    path = Path(file_path)
+    if not path.exists() or path.suffix in ('.gz', '.zst'):
+        return None
+    if path.stat().st_size < min_bytes:
+        return None
+
+    dict_data = _load_zstd_dict(cwd or get_cwd())
+    compressor = (zstd.ZstdCompressor(level=level, dict_data=dict_data)
+                  if dict_data else zstd.ZstdCompressor(level=level))
+
+    compressed_path = path.with_suffix(path.suffix + '.zst')
+    try:
+        with open(path, 'rb') as f_in, open(compressed_path, 'wb') as f_out:
+            compressor.copy_stream(f_in, f_out)
+
+        path.unlink()
+        return str(compressed_path)
+    except Exception:
+        if compressed_path.exists():
+            compressed_path.unlink()
+        return None
+
+
 def decompress_file(file_path: str) -> Optional[str]:
     """
     Decompress a gzipped file.
@@ -217,6 +474,20 @@ def decompress_file(file_path: str) -> Optional[str]:
     if not path.exists():
         return None
 
+    if path.suffix == '.zst':
+        if zstd is None:
+            return None
+        dict_data = _load_zstd_dict(get_cwd())
+        for dctx in ([zstd.ZstdDecompressor(dict_data=dict_data)] if dict_data
+                     else []) + [zstd.ZstdDecompressor()]:
+            try:
+                with open(path, 'rb') as f:
+                    return dctx.stream_reader(f).read().decode(
+                        'utf-8', 'replace')
+            except Exception:
+                continue
+        return None
+
     if not path.suffix == '.gz':
         # Not compressed, read normally
         return path.read_text()
@@ -240,15 +511,17 @@ def read_file_auto(file_path: str) -> Optional[str]:
     """
     path = Path(file_path)
     if not path.exists():
-        # Try with .gz extension
-        gz_path = Path(str(file_path) + '.gz')
-        if gz_path.exists():
-            path = gz_path
+        # Try compressed variants
+        for suffix in ('.gz', '.zst'):
+            candidate = Path(str(file_path) + suffix)
+            if candidate.exists():
+                path = candidate
+                break
 
     if not path.exists():
         return None
 
-    if path.suffix == '.gz':
+    if path.suffix in ('.gz', '.zst'):
         return decompress_file(str(path))
     else:
         return path.read_text()
@@ -265,15 +538,18 @@ def get_compression_stats(cwd: str) -> Dict:
     compressed_bytes = 0
     uncompressed_bytes = 0
 
-    for f in scratch_dir.iterdir():
-        if f.is_file():
-            size = f.stat().st_size
-            if f.suffix == '.gz':
-                compressed += 1
-                compressed_bytes += size
-            else:
-                uncompressed += 1
-                uncompressed_bytes += size
+    # scandir entries carry cached stat results from the listing itself,
+    # so this avoids a separate stat call per file
+    with os.scandir(scratch_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                size = entry.stat().st_size
+                if entry.name.endswith(('.gz', '.zst')):
+                    compressed += 1
+                    compressed_bytes += size
+                else:
+                    uncompressed += 1
+                    uncompressed_bytes += size
 
     # Note: savings_bytes would require knowing original uncompressed size of compressed files
     # For now, we report the raw byte counts and let callers compute estimates if needed
@@ -297,6 +573,7 @@ def main():
         print("  compress <file> [min_bytes]  Compress file if eligible")
         print("  read-all [cwd] [limit]    Read all manifest entries")
         print("  stats [cwd]               Show compression statistics")
+        print("  train-dict [cwd]          Train shared zstd dictionary")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -334,9 +611,12 @@ def main():
         limit = int(sys.argv[3]) if len(sys.argv) > 3 else 100
 
         count = 0
-        for entry in read_all_manifests(cwd, limit):
-            print(json.dumps(entry))
+        out = sys.stdout.buffer
+        for line in read_all_manifests(cwd, limit, raw=True):
+            out.write(line)
+            out.write(b'\n')
             count += 1
+        out.flush()
 
         print(f"# Read {count} entries", file=sys.stderr)
 
@@ -348,6 +628,14 @@ def main():
         print(f"Compressed size: {stats['compressed_bytes'] / 1024:.1f}KB")
         print(f"Uncompressed size: {stats['uncompressed_bytes'] / 1024:.1f}KB")
 
+    elif command == 'train-dict':
+        cwd = sys.argv[2] if len(sys.argv) > 2 else get_cwd()
+        result = train_zstd_dictionary(cwd)
+        if result:
+            print(f"Trained dictionary: {result}")
+        else:
+            print("Not trained (zstandard missing or too few samples)")
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
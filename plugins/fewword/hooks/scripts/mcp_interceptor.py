@@ -12,14 +12,36 @@ Write-like MCP operations are gated via PermissionRequest hook instead.
 
 from __future__ import annotations
 
+# Keep module-level imports minimal: this script is spawned fresh on every
+# MCP tool call, and most invocations exit before logging anything.
+# pathlib/datetime are imported where needed.
 import json
 import sys
 import os
-import uuid
-from pathlib import Path
-from datetime import datetime
 
 
+# orjson is optional but several times faster at encoding; fall back to
+# compact stdlib json (same wire format, just without the spaces)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    # Hoisted decoder: json.loads re-dispatches through the default decoder
+    # plus kwarg handling on every call
+    _loads = json.JSONDecoder().decode
+
+
+# Pre-serialized output envelope - only updatedInput varies per event
+_UPDATE_TMPL = ('{"hookSpecificOutput":{"hookEventName":"PreToolUse",'
+                '"permissionDecision":"allow","updatedInput":%s}}')
+
 # Pagination parameters to clamp (name -> max value)
 PAGINATION_PARAMS = {
     'limit': 100,
@@ -32,15 +54,82 @@ PAGINATION_PARAMS = {
     'size': 100,
 }
 
+# Cached keys view for the set intersection in clamp_pagination
+_PAGINATION_KEYS = PAGINATION_PARAMS.keys()
+
+
+# Cached is_disabled result - cwd is constant for the life of the process
+_DISABLED = None
+
 
 def is_disabled(cwd: str) -> bool:
-    """Check if offloading is disabled via env var or file."""
+    """Check if offloading is disabled via env var or file (cached)."""
+    global _DISABLED
+    if _DISABLED is not None:
+        return _DISABLED
     if os.environ.get('FEWWORD_DISABLE'):
-        return True
-    disable_file = Path(cwd) / '.fewword' / 'DISABLE_OFFLOAD'
-    if disable_file.exists():
-        return True
-    return False
+        _DISABLED = True
+    else:
+        # lexists: one stat without following symlinks - presence is enough
+        _DISABLED = os.path.lexists(os.path.join(cwd, '.fewword', 'DISABLE_OFFLOAD'))
+    return _DISABLED
+
+
+# Directories already confirmed this process - skip repeat mkdir walks
+_DIRS_READY: set = set()
+
+
+def _ensure_dir(path):
+    """mkdir -p with per-process existence caching (mkdir stats every parent)."""
+    key = str(path)
+    if key in _DIRS_READY:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY.add(key)
+
+
+# Kept-open fd for FEWWORD_BATCH=1 callers (same pattern as context_save)
+_batch_fd = None
+
+
+def _close_batch_fd():
+    global _batch_fd
+    if _batch_fd is not None:
+        try:
+            os.close(_batch_fd[1])
+        except OSError:
+            pass
+        _batch_fd = None
+
+
+def _jsonl_append(path, entry: dict):
+    """Append one JSON object to a .jsonl file with a single write syscall.
+
+    O_APPEND writes below PIPE_BUF are atomic on POSIX, so concurrent hook
+    processes can't interleave lines. Compact separators keep entries small.
+    With FEWWORD_BATCH=1 the fd stays open across calls (closed at exit) so
+    drivers logging many events in one process pay one open, not one per
+    event; the default stays open-write-close.
+    """
+    _ensure_dir(path.parent)
+
+    payload = _dumps(entry) + b'\n'
+    global _batch_fd
+    if os.environ.get('FEWWORD_BATCH') == '1':
+        path_str = str(path)
+        if _batch_fd is None or _batch_fd[0] != path_str:
+            _close_batch_fd()
+            import atexit
+            fd = os.open(path_str, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _batch_fd = (path_str, fd)
+            atexit.register(_close_batch_fd)
+        os.write(_batch_fd[1], payload)
+        return
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
 
 
 def log_metadata(cwd: str, session_id: str, tool_name: str, tool_input: dict):
@@ -50,13 +139,14 @@ def log_metadata(cwd: str, session_id: str, tool_name: str, tool_input: dict):
     Privacy-safe: logs only tool name, input keys, coarse metrics.
     Does NOT log raw argument values (may contain secrets).
     """
+    from pathlib import Path
+    from datetime import datetime
+
     index_file = Path(cwd) / '.fewword' / 'index' / 'mcp_metadata.jsonl'
 
     try:
-        index_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Generate event ID for correlation
-        event_id = uuid.uuid4().hex[:8]
+        # Generate event ID for correlation (cheaper than uuid4().hex[:8])
+        event_id = os.urandom(4).hex()
 
         # Sanitized entry - NO raw values
         entry = {
@@ -68,8 +158,7 @@ def log_metadata(cwd: str, session_id: str, tool_name: str, tool_input: dict):
             "input_count": len(tool_input),
         }
 
-        with open(index_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        _jsonl_append(index_file, entry)
     except Exception:
         # Don't fail on logging errors
         pass
@@ -81,11 +170,13 @@ def clamp_pagination(tool_input: dict) -> dict:
     Returns dict of clamped parameters (only if changes needed).
     """
     updates = {}
-    for param, max_val in PAGINATION_PARAMS.items():
-        if param in tool_input:
-            current = tool_input[param]
-            if isinstance(current, (int, float)) and current > max_val:
-                updates[param] = max_val
+    # Intersect the (usually small) input keys with the known pagination
+    # params in C instead of probing all eight names per call
+    for param in tool_input.keys() & _PAGINATION_KEYS:
+        current = tool_input[param]
+        max_val = PAGINATION_PARAMS[param]
+        if type(current) in (int, float) and current > max_val:
+            updates[param] = max_val
     return updates
 
 
@@ -94,8 +185,9 @@ def main():
         raw_input = sys.stdin.read()
         if not raw_input.strip():
             sys.exit(0)
-        input_data = json.loads(raw_input)
-    except json.JSONDecodeError:
+        input_data = _loads(raw_input)
+    except ValueError:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
         sys.exit(0)
 
     tool_name = input_data.get("tool_name", "")
@@ -122,14 +214,7 @@ def main():
         # IMPORTANT: Merge updates into full input, don't replace entirely
         # Otherwise we'd strip required params like 'cwd', 'plan', etc.
         full_updated_input = {**tool_input, **pagination_updates}
-        output = {
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "allow",
-                "updatedInput": full_updated_input
-            }
-        }
-        print(json.dumps(output))
+        print(_UPDATE_TMPL % _dumps(full_updated_input).decode())
 
     sys.exit(0)
 
@@ -25,23 +25,55 @@ Note: There is NO "ask" option for PermissionRequest - only allow/deny.
 
 from __future__ import annotations
 
+# Keep module-level imports minimal: this hook is on the permission-dialog
+# race path, and every millisecond of interpreter startup counts.
 import json
 import sys
 import os
-from pathlib import Path
+
+# orjson is optional but several times faster at encoding; fall back to
+# compact stdlib json (same wire format, just without the spaces)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    # Hoisted decoder: json.loads re-dispatches through the default decoder
+    # plus kwarg handling on every call
+    _loads = json.JSONDecoder().decode
+
+
+# Cached is_disabled result - cwd is constant for the life of the process
+_DISABLED = None
+
+
+# Pre-serialized output payloads: the envelope never changes, only the deny
+# message varies (and only it needs JSON escaping). Keeps the critical path
+# free of dict construction + full json.dumps traversal.
+_ALLOW = ('{"hookSpecificOutput":{"hookEventName":"PermissionRequest",'
+          '"decision":{"behavior":"allow"}}}')
+_DENY_TMPL = ('{"hookSpecificOutput":{"hookEventName":"PermissionRequest",'
+              '"decision":{"behavior":"deny","message":%s,"interrupt":false}}}')
 
 
 def is_disabled(cwd: str) -> bool:
-    """Check if gating is disabled via env var or file."""
-    if os.environ.get('FEWWORD_DISABLE'):
-        return True
-    # Also check for explicit allow-write flag
-    if os.environ.get('FEWWORD_ALLOW_WRITE'):
-        return True
-    disable_file = Path(cwd) / '.fewword' / 'DISABLE_OFFLOAD'
-    if disable_file.exists():
-        return True
-    return False
+    """Check if gating is disabled via env var or file (cached)."""
+    global _DISABLED
+    if _DISABLED is not None:
+        return _DISABLED
+    # Env kill switch or explicit allow-write flag
+    if os.environ.get('FEWWORD_DISABLE') or os.environ.get('FEWWORD_ALLOW_WRITE'):
+        _DISABLED = True
+    else:
+        # lexists: one stat without following symlinks - presence is enough
+        _DISABLED = os.path.lexists(os.path.join(cwd, '.fewword', 'DISABLE_OFFLOAD'))
+    return _DISABLED
 
 
 def main():
@@ -49,8 +81,9 @@ def main():
         raw_input = sys.stdin.read()
         if not raw_input.strip():
             sys.exit(0)
-        input_data = json.loads(raw_input)
-    except json.JSONDecodeError:
+        input_data = _loads(raw_input)
+    except ValueError:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
         sys.exit(0)
 
     tool_name = input_data.get("tool_name", "")
@@ -62,31 +95,13 @@ def main():
 
     # Check escape hatch - if disabled, allow all
     if is_disabled(cwd):
-        output = {
-            "hookSpecificOutput": {
-                "hookEventName": "PermissionRequest",
-                "decision": {
-                    "behavior": "allow"
-                }
-            }
-        }
-        print(json.dumps(output))
+        print(_ALLOW)
         sys.exit(0)
 
     # Gate write-like operations with deny + message to model
     # The matcher already filtered for write-like tools, so deny here
-    output = {
-        "hookSpecificOutput": {
-            "hookEventName": "PermissionRequest",
-            "decision": {
-                "behavior": "deny",
-                "message": f"[fewword] MCP write operation '{tool_name}' blocked. Set FEWWORD_ALLOW_WRITE=1 to allow.",
-                "interrupt": False
-            }
-        }
-    }
-
-    print(json.dumps(output))
+    message = f"[fewword] MCP write operation '{tool_name}' blocked. Set FEWWORD_ALLOW_WRITE=1 to allow."
+    print(_DENY_TMPL % _dumps(message).decode())
     sys.exit(0)
 
 
@@ -25,18 +25,18 @@ Environment variables (see config_loader.py for full list):
 
 from __future__ import annotations
 
+import functools
 import json
 import sys
 import os
 import re
-import uuid
-from pathlib import Path
-from datetime import datetime
+import time
 from typing import Optional, Dict, Tuple
 
 # Import FewWord modules (relative import from same directory)
-_script_dir = Path(__file__).parent
-sys.path.insert(0, str(_script_dir))
+# os.path instead of pathlib: keeps pathlib off the per-event startup path
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _script_dir)
 
 try:
     from config_loader import get_config, FewWordConfig
@@ -57,6 +57,23 @@ try:
 except ImportError:
     HAS_REDACTION = False
 
+# orjson is optional but several times faster at encoding; fall back to
+# compact stdlib json (same wire format, just without the spaces)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    # Hoisted decoder: json.loads re-dispatches through the default decoder
+    # plus kwarg handling on every call
+    _loads = json.JSONDecoder().decode
+
 
 # === Configuration (config file + env var overridable) ===
 def _safe_int(env_var: str, default: int) -> int:
@@ -140,21 +157,50 @@ SKIP_PATTERNS = [
     r'<<',                # heredoc (may contain sensitive data)
 ]
 
+# Fused alternation compiled once at module load - one regex scan per command
+# instead of seven separate re.search calls (this runs on every Bash event)
+_SKIP_RE = re.compile('|'.join(f'(?:{p})' for p in SKIP_PATTERNS))
+
+# Filename sanitizer, compiled once (used per event in main)
+_SAFE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+# Cached is_disabled result - cwd is constant for the life of the process
+_DISABLED: Optional[bool] = None
+
 
 def is_disabled(cwd: str) -> bool:
-    """Check if offloading is disabled via env var or file."""
+    """Check if offloading is disabled via env var or file (cached)."""
+    global _DISABLED
+    if _DISABLED is not None:
+        return _DISABLED
     if os.environ.get('FEWWORD_DISABLE'):
-        return True
-    disable_file = Path(cwd) / '.fewword' / 'DISABLE_OFFLOAD'
-    if disable_file.exists():
-        return True
-    return False
+        _DISABLED = True
+    else:
+        # lexists: one stat without following symlinks - presence is enough
+        _DISABLED = os.path.lexists(os.path.join(cwd, '.fewword', 'DISABLE_OFFLOAD'))
+    return _DISABLED
 
 
+# Wrapper/launcher words to skip when finding the real command
+_PREFIXES = frozenset({'sudo', 'env', 'nohup', 'nice', 'time', 'strace', 'ltrace'})
+
+# Commands whose output is bounded well below the inline threshold -
+# wrapping them costs ~5 syscalls (mkdir/tmpfile/cat/rm/stat) to offload
+# a handful of bytes, so don't
+_BOUNDED_OUTPUT = frozenset({
+    'echo', 'pwd', 'whoami', 'id', 'true', 'false', 'basename', 'dirname',
+    'date', 'hostname', 'uname', 'which', 'type', 'test', '[',
+})
+
+
+@functools.lru_cache(maxsize=256)
 def get_first_command(cmd: str) -> str:
-    """Extract the first actual command word, handling prefixes."""
-    cmd = cmd.strip()
-    prefixes = ['sudo', 'env', 'nohup', 'nice', 'time', 'strace', 'ltrace']
+    """Extract the first actual command word, handling prefixes.
+
+    Memoized: should_skip, should_deny_storage and main all ask for the
+    same command within one event, and shell traffic is highly repetitive.
+    """
     words = cmd.split()
 
     for word in words:
@@ -162,7 +208,7 @@ def get_first_command(cmd: str) -> str:
         if '=' in word and not word.startswith('-'):
             continue
         # Skip known prefixes
-        if word in prefixes:
+        if word in _PREFIXES:
             continue
         # Return the actual command (handle full paths)
         return word.split('/')[-1]
@@ -175,9 +221,19 @@ def should_skip(command: str, config: Optional[Dict] = None) -> tuple[bool, str]
     Determine if command should skip offloading.
     Returns (should_skip, reason).
     """
-    if not command or not command.strip():
+    # Checks ordered cheapest-first; every test is independently
+    # disqualifying, so order only affects which reason gets reported
+    if not command:
         return True, "empty command"
 
+    stripped = command.strip()
+    if not stripped:
+        return True, "empty command"
+
+    # Skip trivial commands (length test beats any scan)
+    if len(stripped) < 10:
+        return True, "trivial command"
+
     # Check for pipes - SKIP (exit code masking)
     if '|' in command:
         return True, "pipeline (skips to avoid exit code issues)"
@@ -188,18 +244,37 @@ def should_skip(command: str, config: Optional[Dict] = None) -> tuple[bool, str]
     if first_cmd in INTERACTIVE_COMMANDS:
         return True, f"interactive: {first_cmd}"
 
-    # Check skip patterns (redirects, heredocs, etc.)
-    for pattern in SKIP_PATTERNS:
-        if re.search(pattern, command):
-            return True, "already handling output"
+    # Commands with predictably tiny output aren't worth the wrapper
+    if first_cmd in _BOUNDED_OUTPUT:
+        return True, "bounded output"
 
-    # Skip trivial commands
-    if len(command.strip()) < 10:
-        return True, "trivial command"
+    # Check skip patterns (redirects, heredocs, etc.) - single fused scan,
+    # last because it's the only non-constant-time test left
+    if _SKIP_RE.search(command):
+        return True, "already handling output"
 
     return False, ""
 
 
+@functools.lru_cache(maxsize=8)
+def _compiled_deny(patterns: tuple) -> tuple:
+    """Compile deny patterns once per distinct config.
+
+    re.search(str, ...) pays the compile-cache probe per pattern per call;
+    compiling here makes each check a direct C-level scan. Invalid patterns
+    warn once per process instead of once per command - the user thinks
+    they're working but they're not.
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append((re.compile(pattern), pattern))
+        except re.error as e:
+            print(f"[FewWord] Warning: Invalid deny pattern '{pattern}': {e}",
+                  file=sys.stderr)
+    return tuple(compiled)
+
+
 def should_deny_storage(command: str, config: Dict) -> tuple[bool, str]:
     """
     Check if command matches deny rules (pointer-only, no output file).
@@ -219,21 +294,16 @@ def should_deny_storage(command: str, config: Dict) -> tuple[bool, str]:
         return True, f"deny_cmd: {first_cmd}"
 
     # Check deny patterns against full command
-    for pattern in deny_patterns:
-        try:
-            if re.search(pattern, command):
-                return True, f"deny_pattern: {pattern}"
-        except re.error as e:
-            # Warn about invalid patterns - user thinks it's working but it's not
-            import sys
-            print(f"[FewWord] Warning: Invalid deny pattern '{pattern}': {e}", file=sys.stderr)
+    for rx, pattern in _compiled_deny(tuple(deny_patterns)):
+        if rx.search(command):
+            return True, f"deny_pattern: {pattern}"
 
     return False, ""
 
 
 def get_session_id(cwd: str) -> str:
     """Read current session ID from session.json."""
-    session_file = Path(cwd) / '.fewword' / 'index' / 'session.json'
+    session_file = os.path.join(cwd, '.fewword', 'index', 'session.json')
     try:
         with open(session_file, 'r') as f:
             data = json.load(f)
@@ -242,103 +312,77 @@ def get_session_id(cwd: str) -> str:
         return ''
 
 
-def generate_wrapper(original_cmd: str, output_dir: str, safe_cmd: str,
-                     timestamp: str, event_id: str, cwd: str, session_id: str,
-                     cmd_token: str = '', cmd_group: str = '',
-                     config: Optional[Dict] = None, denied: bool = False,
-                     deny_reason: str = '') -> str:
-    """
-    Generate bash wrapper that implements tiered offloading.
+# The wrapper body is assembled once at import time. The tier thresholds and
+# display-mode branches (SHOW_PATH / VERBOSE_POINTER / PEEK_ON_POINTER) are
+# fixed per process, so there is no reason to rebuild multi-KB f-strings on
+# every Bash event - generate_wrapper just substitutes the per-event tokens
+# in a single regex pass.
 
-    v1.3.6: Tiered logic + compact pointer + smart preview + session tracking + security hardening
-            + cmd_token/cmd_group + denied mode
+_TOKEN_RE = re.compile(r'@FW_[A-Z_]+@')
 
-    Tiers:
-    1. < INLINE_MAX (512B): Show inline, delete file
-    2. INLINE_MAX - PREVIEW_MIN (512B-4KB): Compact pointer only
-    3. > PREVIEW_MIN (4KB+): Compact pointer + preview (failures only)
+# Pre-serialized output envelope - only the wrapped command varies per event
+_OUTPUT_TMPL = ('{"hookSpecificOutput":{"hookEventName":"PreToolUse",'
+                '"permissionDecision":"allow","updatedInput":{"command":%s}}}')
 
-    Denied mode: Pointer only, no output file stored
+
+def _shq(value: str) -> str:
+    """Escape a value for embedding inside single quotes in the wrapper."""
+    return value.replace("'", "'\"'\"'")
+
+
+def _build_wrapper_template() -> str:
+    """Bake the wrapper template for this process's configuration.
+
+    The tier thresholds, preview lengths and display-mode branches
+    (SHOW_PATH / VERBOSE_POINTER / PEEK_ON_POINTER) all come from the
+    env-derived module constants, fixed for the life of the process - so
+    the right variant is assembled and the constants substituted once at
+    import. Per-event @FW_*@ tokens are left for generate_wrapper.
     """
-    # Use config if provided, else fall back to globals
-    if config:
-        thresholds = config.get('thresholds', {})
-        pointer_cfg = config.get('pointer', {})
-        inline_max = thresholds.get('inline_max', INLINE_MAX)
-        preview_min = thresholds.get('preview_min', PREVIEW_MIN)
-        preview_lines = thresholds.get('preview_lines', PREVIEW_LINES)
-        open_cmd = pointer_cfg.get('open_cmd', OPEN_CMD)
-        show_path = pointer_cfg.get('show_path', SHOW_PATH)
-        verbose_pointer = pointer_cfg.get('verbose', VERBOSE_POINTER)
-        peek_on_pointer = pointer_cfg.get('peek_on_pointer', PEEK_ON_POINTER)
-        peek_tier2 = pointer_cfg.get('peek_tier2_lines', PEEK_TIER2_LINES)
-        peek_tier3 = pointer_cfg.get('peek_tier3_lines', PEEK_TIER3_LINES)
-    else:
-        inline_max = INLINE_MAX
-        preview_min = PREVIEW_MIN
-        preview_lines = PREVIEW_LINES
-        open_cmd = OPEN_CMD
-        show_path = SHOW_PATH
-        verbose_pointer = VERBOSE_POINTER
-        peek_on_pointer = PEEK_ON_POINTER
-        peek_tier2 = PEEK_TIER2_LINES
-        peek_tier3 = PEEK_TIER3_LINES
-
-    # Escape paths and values for shell (single-quote safe)
-    escaped_dir = output_dir.replace("'", "'\"'\"'")
-    escaped_cwd = cwd.replace("'", "'\"'\"'")
-    escaped_open_cmd = open_cmd.replace("'", "'\"'\"'")
-    escaped_session = session_id.replace("'", "'\"'\"'")
-    escaped_cmd_token = cmd_token.replace("'", "'\"'\"'")
-    escaped_cmd_group = cmd_group.replace("'", "'\"'\"'")
-    # Pre-compute expressions to avoid f-string compatibility issues (Python 3.11+)
-    denied_str = 'true' if denied else 'false'
-    escaped_deny_reason = deny_reason.replace("'", "'\"'\"'") if deny_reason else ""
-
-    wrapper = f'''
+    head = r"""
 set -o pipefail
 
-__fw_dir='{escaped_dir}'
-__fw_cwd='{escaped_cwd}'
-__fw_cmd='{safe_cmd}'
-__fw_ts='{timestamp}'
-__fw_id='{event_id}'
-__fw_session='{escaped_session}'
-__fw_open_cmd='{escaped_open_cmd}'
-__fw_cmd_token='{escaped_cmd_token}'
-__fw_cmd_group='{escaped_cmd_group}'
+__fw_dir='@FW_DIR@'
+__fw_cwd='@FW_CWD@'
+__fw_cmd='@FW_CMD@'
+__fw_ts='@FW_TS@'
+__fw_id='@FW_ID@'
+__fw_session='@FW_SESSION@'
+__fw_open_cmd='@FW_OPEN_CMD@'
+__fw_cmd_token='@FW_CMD_TOKEN@'
+__fw_cmd_group='@FW_CMD_GROUP@'
 __fw_manifest="$__fw_cwd/.fewword/index/tool_outputs.jsonl"
-__fw_denied={denied_str}
-__fw_deny_reason='{escaped_deny_reason}'
+__fw_denied=@FW_DENIED@
+__fw_deny_reason='@FW_DENY_REASON@'
 
 # P1 fix #13: Robust JSON escape helper
 # Uses jq -Rs if available (proper JSON escaping), falls back to sed-based escaping
-__fw_json_escape() {{
+__fw_json_escape() {
   # Try jq first (most reliable)
   if command -v jq >/dev/null 2>&1; then
     printf '%s' "$1" | jq -Rs '.' | sed 's/^"//;s/"$//'
   else
-    # Fallback: escape backslash, quote, tab (\\t), newline (\\n), carriage return (\\r)
-    printf '%s' "$1" | sed -e 's/\\\\/\\\\\\\\/g' -e 's/"/\\\\"/g' | \\
-      awk '{{gsub(/\\t/, "\\\\t"); gsub(/\\r/, "\\\\r"); printf "%s\\\\n", $0}}' | \\
-      sed 's/\\\\n$//'
+    # Fallback: escape backslash, quote, tab (\t), newline (\n), carriage return (\r)
+    printf '%s' "$1" | sed -e 's/\\/\\\\/g' -e 's/"/\\"/g' | \
+      awk '{gsub(/\t/, "\\t"); gsub(/\r/, "\\r"); printf "%s\\n", $0}' | \
+      sed 's/\\n$//'
   fi
-}}
+}
 
 mkdir -p "$__fw_dir" 2>/dev/null
 mkdir -p "$(dirname "$__fw_manifest")" 2>/dev/null
 
 # Temporary file (without exit code)
-__fw_tmp="$__fw_dir/${{__fw_cmd}}_${{__fw_ts}}_${{__fw_id}}_tmp.txt"
+__fw_tmp="$__fw_dir/${__fw_cmd}_${__fw_ts}_${__fw_id}_tmp.txt"
 
 # 1. Capture stdout+stderr to temp file, preserve real exit code
-# Use subshell ( ) not compound command {{ }} so 'exit N' in command doesn't exit wrapper
-( {original_cmd} ) > "$__fw_tmp" 2>&1
+# Use subshell ( ) not compound command { } so 'exit N' in command doesn't exit wrapper
+( @FW_ORIGINAL_CMD@ ) > "$__fw_tmp" 2>&1
 __fw_exit=$?
 
 # 2. Final filename with exit code
-__fw_out="$__fw_dir/${{__fw_cmd}}_${{__fw_ts}}_${{__fw_id}}_exit${{__fw_exit}}.txt"
-__fw_rel_path=".fewword/scratch/tool_outputs/${{__fw_cmd}}_${{__fw_ts}}_${{__fw_id}}_exit${{__fw_exit}}.txt"
+__fw_out="$__fw_dir/${__fw_cmd}_${__fw_ts}_${__fw_id}_exit${__fw_exit}.txt"
+__fw_rel_path=".fewword/scratch/tool_outputs/${__fw_cmd}_${__fw_ts}_${__fw_id}_exit${__fw_exit}.txt"
 
 # 3. Rename temp to final (unless denied)
 if [ "$__fw_denied" = "true" ]; then
@@ -354,35 +398,58 @@ fi
 
 mv "$__fw_tmp" "$__fw_out" 2>/dev/null
 
-# 4. Measure size
-__fw_bytes=$(wc -c < "$__fw_out" 2>/dev/null | tr -d ' ')
-__fw_lines=$(wc -l < "$__fw_out" 2>/dev/null | tr -d ' ')
+# 4. Measure size - stat reads only the inode (GNU then BSD), wc as last resort
+__fw_bytes=$(stat -c %s "$__fw_out" 2>/dev/null || stat -f %z "$__fw_out" 2>/dev/null)
+[ -n "$__fw_bytes" ] || __fw_bytes=$(wc -c < "$__fw_out" 2>/dev/null | tr -d ' ')
+
+# 5. Line count, display size and pointer are only needed past the inline
+# tier - skip the full-file re-read for small outputs (the common case)
+__fw_lines=0
+if [ "${__fw_bytes:-0}" -ge @FW_INLINE_MAX@ ]; then
+  __fw_lines=$(wc -l < "$__fw_out" 2>/dev/null | tr -d ' ')
+
+  # Format size for display (human readable)
+  if [ "${__fw_bytes:-0}" -ge 1048576 ]; then
+    __fw_size="$(((__fw_bytes + 524288) / 1048576))M"
+  elif [ "${__fw_bytes:-0}" -ge 1024 ]; then
+    __fw_size="$(((__fw_bytes + 512) / 1024))K"
+  else
+    __fw_size="${__fw_bytes}B"
+  fi
 
-# 5. Format size for display (human readable)
-if [ "${{__fw_bytes:-0}}" -ge 1048576 ]; then
-  __fw_size="$(((__fw_bytes + 524288) / 1048576))M"
-elif [ "${{__fw_bytes:-0}}" -ge 1024 ]; then
-  __fw_size="$(((__fw_bytes + 512) / 1024))K"
-else
-  __fw_size="${{__fw_bytes}}B"
+  # 6. Build compact pointer line (single line, no newlines)
+  __fw_pointer="[fw $__fw_id] $__fw_cmd e=$__fw_exit $__fw_size ${__fw_lines}L | $__fw_open_cmd $__fw_id"
 fi
+"""
 
-# 6. Build compact pointer line (single line, no newlines)
-__fw_pointer="[fw $__fw_id] $__fw_cmd e=$__fw_exit $__fw_size ${{__fw_lines}}L | $__fw_open_cmd $__fw_id"
-'''
-
-    # Add path to pointer if FEWWORD_SHOW_PATH=1
-    if SHOW_PATH:
-        wrapper += '''
+    show_path = r"""
 __fw_pointer="$__fw_pointer | $__fw_rel_path"
-'''
+"""
 
-    # Verbose pointer for backwards compat
-    if VERBOSE_POINTER:
-        wrapper += f'''
+    # Shared manifest-append + LATEST-symlink block (2-space indented for
+    # use inside tier branches)
+    record = r"""
+  # Write manifest entry (append-only) with cmd_token and cmd_group (v1.3.6)
+  # Use JSON escape helper for values that could contain special characters
+  __fw_now=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
+  __fw_esc_cmd=$(__fw_json_escape "$__fw_cmd")
+  __fw_esc_cmd_token=$(__fw_json_escape "$__fw_cmd_token")
+  __fw_esc_cmd_group=$(__fw_json_escape "$__fw_cmd_group")
+  __fw_esc_path=$(__fw_json_escape "$__fw_rel_path")
+  printf '{"type":"offload","id":"%s","session_id":"%s","created_at":"%s","cmd":"%s","cmd_token":"%s","cmd_group":"%s","exit_code":%d,"bytes":%d,"lines":%d,"path":"%s"}\n' \
+    "$__fw_id" "$__fw_session" "$__fw_now" "$__fw_esc_cmd" "$__fw_esc_cmd_token" "$__fw_esc_cmd_group" "$__fw_exit" "$__fw_bytes" "$__fw_lines" "$__fw_esc_path" \
+    >> "$__fw_manifest" 2>/dev/null
+
+  # Create LATEST symlinks (absolute paths) - with Windows fallback
+  __fw_abs_out="$(cd "$(dirname "$__fw_out")" && pwd)/$(basename "$__fw_out")"
+  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST.txt"
+  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST_$__fw_cmd.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST_$__fw_cmd.txt"
+"""
+
+    verbose = r"""
 # VERBOSE MODE (FEWWORD_VERBOSE_POINTER=1)
 # Tier decision with verbose output
-if [ "${{__fw_bytes:-0}}" -lt {INLINE_MAX} ]; then
+if [ "${__fw_bytes:-0}" -lt @FW_INLINE_MAX@ ]; then
   # INLINE: show full content, delete file
   cat "$__fw_out"
   rm -f "$__fw_out"
@@ -415,96 +482,122 @@ else
   echo "  Full: cat $__fw_out"
   echo "  Latest: cat $__fw_dir/LATEST_$__fw_cmd.txt"
   echo "  Grep: grep 'pattern' $__fw_out"
+""" + record + r"""fi
+"""
 
-  # Write manifest entry (append-only) with cmd_token and cmd_group (v1.3.6)
-  # Use JSON escape helper for values that could contain special characters
-  __fw_now=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
-  __fw_esc_cmd=$(__fw_json_escape "$__fw_cmd")
-  __fw_esc_cmd_token=$(__fw_json_escape "$__fw_cmd_token")
-  __fw_esc_cmd_group=$(__fw_json_escape "$__fw_cmd_group")
-  __fw_esc_path=$(__fw_json_escape "$__fw_rel_path")
-  printf '{{"type":"offload","id":"%s","session_id":"%s","created_at":"%s","cmd":"%s","cmd_token":"%s","cmd_group":"%s","exit_code":%d,"bytes":%d,"lines":%d,"path":"%s"}}\\n' \\
-    "$__fw_id" "$__fw_session" "$__fw_now" "$__fw_esc_cmd" "$__fw_esc_cmd_token" "$__fw_esc_cmd_group" "$__fw_exit" "$__fw_bytes" "$__fw_lines" "$__fw_esc_path" \\
-    >> "$__fw_manifest" 2>/dev/null
-
-  # Create LATEST symlinks (absolute paths) - with Windows fallback
-  __fw_abs_out="$(cd "$(dirname "$__fw_out")" && pwd)/$(basename "$__fw_out")"
-  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST.txt"
-  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST_$__fw_cmd.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST_$__fw_cmd.txt"
-fi
-'''
-    else:
-        # Compact mode (default)
-        wrapper += f'''
+    compact_head = r"""
 # COMPACT MODE (default)
-# Tier decision: inline < {INLINE_MAX}B, compact {INLINE_MAX}B-{PREVIEW_MIN}B, preview > {PREVIEW_MIN}B
-if [ "${{__fw_bytes:-0}}" -lt {INLINE_MAX} ]; then
+# Tier decision: inline < @FW_INLINE_MAX@B, compact @FW_INLINE_MAX@B-@FW_PREVIEW_MIN@B, preview > @FW_PREVIEW_MIN@B
+if [ "${__fw_bytes:-0}" -lt @FW_INLINE_MAX@ ]; then
   # TIER 1 - INLINE: show full content, delete file
   cat "$__fw_out"
   rm -f "$__fw_out"
-elif [ "${{__fw_bytes:-0}}" -lt {PREVIEW_MIN} ]; then
+elif [ "${__fw_bytes:-0}" -lt @FW_PREVIEW_MIN@ ]; then
   # TIER 2 - COMPACT: pointer + optional peek preview (failures only)
   echo "$__fw_pointer"
-'''
+"""
 
-        # Add peek preview for Tier 2 if PEEK_ON_POINTER is enabled
-        if PEEK_ON_POINTER:
-            wrapper += f'''
+    tier2_peek = r"""
   # Show peek preview only for failures (FEWWORD_PEEK_ON_POINTER=1)
   if [ "$__fw_exit" -ne 0 ]; then
-    tail -{PEEK_TIER2_LINES} "$__fw_out" | cut -c1-{PREVIEW_LINE_MAX}
+    tail -@FW_PEEK_LINES@ "$__fw_out" | cut -c1-@FW_LINE_MAX@
   fi
-'''
-
-        wrapper += f'''
-  # Write manifest entry (append-only) with cmd_token and cmd_group (v1.3.6)
-  # Use JSON escape helper for values that could contain special characters
-  __fw_now=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
-  __fw_esc_cmd=$(__fw_json_escape "$__fw_cmd")
-  __fw_esc_cmd_token=$(__fw_json_escape "$__fw_cmd_token")
-  __fw_esc_cmd_group=$(__fw_json_escape "$__fw_cmd_group")
-  __fw_esc_path=$(__fw_json_escape "$__fw_rel_path")
-  printf '{{"type":"offload","id":"%s","session_id":"%s","created_at":"%s","cmd":"%s","cmd_token":"%s","cmd_group":"%s","exit_code":%d,"bytes":%d,"lines":%d,"path":"%s"}}\\n' \\
-    "$__fw_id" "$__fw_session" "$__fw_now" "$__fw_esc_cmd" "$__fw_esc_cmd_token" "$__fw_esc_cmd_group" "$__fw_exit" "$__fw_bytes" "$__fw_lines" "$__fw_esc_path" \\
-    >> "$__fw_manifest" 2>/dev/null
+"""
 
-  # Create LATEST symlinks (absolute paths) - with Windows fallback
-  __fw_abs_out="$(cd "$(dirname "$__fw_out")" && pwd)/$(basename "$__fw_out")"
-  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST.txt"
-  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST_$__fw_cmd.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST_$__fw_cmd.txt"
-else
+    compact_rest = record + r"""else
   # TIER 3 - PREVIEW: pointer + smart preview (failures only)
   echo "$__fw_pointer"
 
   # Show preview only for failures (exit != 0)
   if [ "$__fw_exit" -ne 0 ]; then
-    # Plain tail - last {PEEK_TIER3_LINES if PEEK_ON_POINTER else PREVIEW_LINES} lines, truncated to {PREVIEW_LINE_MAX} chars
-    tail -{PEEK_TIER3_LINES if PEEK_ON_POINTER else PREVIEW_LINES} "$__fw_out" | cut -c1-{PREVIEW_LINE_MAX}
+    # Plain tail - last @FW_TAIL_LINES@ lines, truncated to @FW_LINE_MAX@ chars
+    tail -@FW_TAIL_LINES@ "$__fw_out" | cut -c1-@FW_LINE_MAX@
   fi
+""" + record + r"""fi
+"""
 
-  # Write manifest entry (append-only) with cmd_token and cmd_group (v1.3.6)
-  # Use JSON escape helper for values that could contain special characters
-  __fw_now=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
-  __fw_esc_cmd=$(__fw_json_escape "$__fw_cmd")
-  __fw_esc_cmd_token=$(__fw_json_escape "$__fw_cmd_token")
-  __fw_esc_cmd_group=$(__fw_json_escape "$__fw_cmd_group")
-  __fw_esc_path=$(__fw_json_escape "$__fw_rel_path")
-  printf '{{"type":"offload","id":"%s","session_id":"%s","created_at":"%s","cmd":"%s","cmd_token":"%s","cmd_group":"%s","exit_code":%d,"bytes":%d,"lines":%d,"path":"%s"}}\\n' \\
-    "$__fw_id" "$__fw_session" "$__fw_now" "$__fw_esc_cmd" "$__fw_esc_cmd_token" "$__fw_esc_cmd_group" "$__fw_exit" "$__fw_bytes" "$__fw_lines" "$__fw_esc_path" \\
-    >> "$__fw_manifest" 2>/dev/null
-
-  # Create LATEST symlinks (absolute paths) - with Windows fallback
-  __fw_abs_out="$(cd "$(dirname "$__fw_out")" && pwd)/$(basename "$__fw_out")"
-  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST.txt"
-  ln -sf "$__fw_abs_out" "$__fw_dir/LATEST_$__fw_cmd.txt" 2>/dev/null || echo "$__fw_abs_out" > "$__fw_dir/LATEST_$__fw_cmd.txt"
-fi
-'''
-
-    wrapper += '''
+    footer = r"""
 # Always preserve exit code
 exit $__fw_exit
-'''
-    return wrapper.strip()
+"""
+
+    parts = [head]
+    if SHOW_PATH:
+        parts.append(show_path)
+    if VERBOSE_POINTER:
+        parts.append(verbose)
+    else:
+        parts.append(compact_head)
+        if PEEK_ON_POINTER:
+            parts.append(tier2_peek)
+        parts.append(compact_rest)
+    parts.append(footer)
+
+    constants = {
+        '@FW_INLINE_MAX@': str(INLINE_MAX),
+        '@FW_PREVIEW_MIN@': str(PREVIEW_MIN),
+        '@FW_LINE_MAX@': str(PREVIEW_LINE_MAX),
+        '@FW_PEEK_LINES@': str(PEEK_TIER2_LINES),
+        '@FW_TAIL_LINES@': str(PEEK_TIER3_LINES if PEEK_ON_POINTER
+                               else PREVIEW_LINES),
+    }
+    # Substitute only the constant tokens; per-event tokens survive for
+    # generate_wrapper's pass
+    return _TOKEN_RE.sub(lambda m: constants.get(m.group(0), m.group(0)),
+                         ''.join(parts)).strip()
+
+
+_WRAPPER_TEMPLATE = _build_wrapper_template()
+
+
+def generate_wrapper(original_cmd: str, output_dir: str, safe_cmd: str,
+                     timestamp: str, event_id: str, cwd: str, session_id: str,
+                     cmd_token: str = '', cmd_group: str = '',
+                     config: Optional[Dict] = None, denied: bool = False,
+                     deny_reason: str = '') -> str:
+    """
+    Generate bash wrapper that implements tiered offloading.
+
+    v1.3.6: Tiered logic + compact pointer + smart preview + session tracking + security hardening
+            + cmd_token/cmd_group + denied mode
+
+    Tiers:
+    1. < INLINE_MAX (512B): Show inline, delete file
+    2. INLINE_MAX - PREVIEW_MIN (512B-4KB): Compact pointer only
+    3. > PREVIEW_MIN (4KB+): Compact pointer + preview (failures only)
+
+    Denied mode: Pointer only, no output file stored
+    """
+    # Only the open command is honored from the per-event config. The tier
+    # thresholds, preview lengths and display modes are baked into the
+    # template at import from the env-derived module constants;
+    # config['thresholds']/config['pointer'] display values do not reach
+    # the wrapper (they never did - the old per-call builder computed them
+    # but interpolated the module constants).
+    if config:
+        open_cmd = config.get('pointer', {}).get('open_cmd', OPEN_CMD)
+    else:
+        open_cmd = OPEN_CMD
+
+    # safe_cmd/timestamp/event_id are constrained to [a-zA-Z0-9_-] and need
+    # no shell escaping; everything else gets single-quote escaped
+    values = {
+        '@FW_DIR@': _shq(output_dir),
+        '@FW_CWD@': _shq(cwd),
+        '@FW_CMD@': safe_cmd,
+        '@FW_TS@': timestamp,
+        '@FW_ID@': event_id,
+        '@FW_SESSION@': _shq(session_id),
+        '@FW_OPEN_CMD@': _shq(open_cmd),
+        '@FW_CMD_TOKEN@': _shq(cmd_token),
+        '@FW_CMD_GROUP@': _shq(cmd_group),
+        '@FW_DENIED@': 'true' if denied else 'false',
+        '@FW_DENY_REASON@': _shq(deny_reason) if deny_reason else '',
+        '@FW_ORIGINAL_CMD@': original_cmd,
+    }
+
+    # Single pass: substituted content is never itself re-scanned for tokens
+    return _TOKEN_RE.sub(lambda m: values[m.group(0)], _WRAPPER_TEMPLATE)
 
 
 def main():
@@ -513,8 +606,9 @@ def main():
         raw_input = sys.stdin.read()
         if not raw_input.strip():
             sys.exit(0)
-        input_data = json.loads(raw_input)
-    except json.JSONDecodeError:
+        input_data = _loads(raw_input)
+    except ValueError:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
         # Invalid JSON - pass through silently
         sys.exit(0)
 
@@ -545,13 +639,13 @@ def main():
     # Get session ID from session.json
     session_id = get_session_id(cwd)
 
-    # Generate unique event ID for correlation
-    event_id = uuid.uuid4().hex[:8]
+    # Generate unique event ID for correlation (cheaper than uuid4().hex[:8])
+    event_id = os.urandom(4).hex()
 
-    # Generate filename components
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Generate filename components (time.strftime skips the datetime object)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     first_cmd = get_first_command(command)
-    safe_cmd = re.sub(r'[^a-zA-Z0-9_-]', '_', first_cmd)[:20]
+    safe_cmd = _SAFE_RE.sub('_', first_cmd)[:20]
     output_dir = f"{cwd}/.fewword/scratch/tool_outputs"
 
     # Extract cmd_token and cmd_group (v1.3.6)
@@ -582,18 +676,9 @@ def main():
         deny_reason=deny_reason
     )
 
-    # Return the updated input with correct JSON envelope
-    output = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "allow",
-            "updatedInput": {
-                "command": wrapped
-            }
-        }
-    }
-
-    print(json.dumps(output))
+    # Return the updated input with correct JSON envelope - only the wrapped
+    # command needs escaping, the envelope itself is pre-serialized
+    print(_OUTPUT_TMPL % _dumps(wrapped).decode())
     sys.exit(0)
 
 
@@ -11,9 +11,9 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
 import os
-from datetime import datetime, timedelta
+import sys
+import time
 from pathlib import Path
 
 
@@ -30,33 +30,45 @@ RETENTION = {
 }
 
 
-def get_file_age_minutes(file_path: Path) -> float:
-    """Get file age in minutes."""
-    mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-    age = datetime.now() - mtime
-    return age.total_seconds() / 60
+def scan_files(dir_path):
+    """Recursively yield os.DirEntry objects for regular files.
+
+    DirEntry.is_file/is_dir come from readdir d_type (no extra stat on most
+    filesystems), and entry.stat() is called at most once per file by callers.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from scan_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except OSError:
+        return
 
 
 def cleanup_directory(dir_path: Path, max_age_minutes: int, dry_run: bool = False) -> list:
     """Clean files older than max_age_minutes. Returns list of deleted files."""
     deleted = []
-    
+
     if not dir_path.exists():
         return deleted
-    
-    for file_path in dir_path.rglob("*"):
-        if not file_path.is_file():
-            continue
-            
-        age = get_file_age_minutes(file_path)
-        if age > max_age_minutes:
+
+    # Plain float comparison per file; now/cutoff computed once for the walk
+    now = time.time()
+    cutoff = now - max_age_minutes * 60
+
+    for entry in scan_files(dir_path):
+        mtime = entry.stat().st_mtime
+        if mtime < cutoff:
             if dry_run:
-                print(f"Would delete: {file_path} (age: {age:.0f}m)")
+                age_minutes = (now - mtime) / 60
+                print(f"Would delete: {entry.path} (age: {age_minutes:.0f}m)")
             else:
-                file_path.unlink()
-                print(f"Deleted: {file_path}")
-            deleted.append(file_path)
-    
+                os.unlink(entry.path)
+                print(f"Deleted: {entry.path}")
+            deleted.append(entry.path)
+
     return deleted
 
 
@@ -68,16 +80,15 @@ def cleanup_all(dry_run: bool = False) -> dict:
         print("No .fewword/scratch/ directory found")
         return results
 
-    for file_path in SCRATCH_DIR.rglob("*"):
-        if file_path.is_file():
-            size = file_path.stat().st_size
-            if dry_run:
-                print(f"Would delete: {file_path} ({size:,} bytes)")
-            else:
-                file_path.unlink()
-                print(f"Deleted: {file_path}")
-            results["deleted"] += 1
-            results["freed_bytes"] += size
+    for entry in scan_files(SCRATCH_DIR):
+        size = entry.stat().st_size
+        if dry_run:
+            print(f"Would delete: {entry.path} ({size:,} bytes)")
+        else:
+            os.unlink(entry.path)
+            print(f"Deleted: {entry.path}")
+        results["deleted"] += 1
+        results["freed_bytes"] += size
 
     return results
 
@@ -100,10 +111,9 @@ def show_stats():
         total_size = 0
         file_count = 0
 
-        for file_path in dir_path.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-                file_count += 1
+        for entry in scan_files(dir_path):
+            total_size += entry.stat().st_size
+            file_count += 1
 
         size_mb = total_size / (1024 * 1024)
         print(f"{name}: {file_count} files, {size_mb:.2f} MB")
@@ -111,37 +121,70 @@ def show_stats():
     print()
 
 
+USAGE = """usage: cleanup_scratch.py [--age MINUTES] [--all] [--dry-run] [--stats]
+
+Clean up scratch files
+
+options:
+  --age MINUTES  Max file age in minutes
+  --all          Remove all scratch files
+  --dry-run      Show what would be deleted
+  --stats        Show storage stats only"""
+
+
+def parse_args(argv: list) -> dict:
+    """Tiny hand-rolled parser: four flags don't justify argparse's
+    import + ArgumentParser construction cost on every invocation."""
+    args = {"age": None, "all": False, "dry_run": False, "stats": False}
+    it = iter(argv)
+    for arg in it:
+        if arg == "--age":
+            try:
+                args["age"] = int(next(it))
+            except (StopIteration, ValueError):
+                print(USAGE, file=sys.stderr)
+                sys.exit(2)
+        elif arg == "--all":
+            args["all"] = True
+        elif arg == "--dry-run":
+            args["dry_run"] = True
+        elif arg == "--stats":
+            args["stats"] = True
+        elif arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        else:
+            print(f"unrecognized argument: {arg}", file=sys.stderr)
+            print(USAGE, file=sys.stderr)
+            sys.exit(2)
+    return args
+
+
 def main():
-    parser = argparse.ArgumentParser(description="Clean up scratch files")
-    parser.add_argument("--age", type=int, help="Max file age in minutes")
-    parser.add_argument("--all", action="store_true", help="Remove all scratch files")
-    parser.add_argument("--dry-run", action="store_true", help="Show what would be deleted")
-    parser.add_argument("--stats", action="store_true", help="Show storage stats only")
-    
-    args = parser.parse_args()
-    
-    if args.stats:
+    args = parse_args(sys.argv[1:])
+
+    if args["stats"]:
         show_stats()
         return
-    
+
     show_stats()
-    
-    if args.all:
+
+    if args["all"]:
         print("=== Cleaning All Scratch Files ===\n")
-        results = cleanup_all(args.dry_run)
+        results = cleanup_all(args["dry_run"])
         freed_mb = results["freed_bytes"] / (1024 * 1024)
-        print(f"\n{'Would delete' if args.dry_run else 'Deleted'}: {results['deleted']} files ({freed_mb:.2f} MB)")
+        print(f"\n{'Would delete' if args['dry_run'] else 'Deleted'}: {results['deleted']} files ({freed_mb:.2f} MB)")
     else:
         print("=== Cleaning by Retention Policy ===\n")
         total_deleted = 0
-        
+
         for subdir, max_age in RETENTION.items():
             dir_path = SCRATCH_DIR / subdir
-            age = args.age if args.age else max_age
-            deleted = cleanup_directory(dir_path, age, args.dry_run)
+            age = args["age"] if args["age"] else max_age
+            deleted = cleanup_directory(dir_path, age, args["dry_run"])
             total_deleted += len(deleted)
-        
-        print(f"\n{'Would delete' if args.dry_run else 'Deleted'}: {total_deleted} files")
+
+        print(f"\n{'Would delete' if args['dry_run'] else 'Deleted'}: {total_deleted} files")
 
 
 if __name__ == "__main__":
@@ -9,37 +9,54 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
+import re
 import sys
 import os
-from datetime import datetime
+import time
 from pathlib import Path
 
 
 SCRATCH_DIR = Path(".fewword/scratch/tool_outputs")
 TOKEN_THRESHOLD = 2000  # Approximate token count threshold
 
+# Directories already confirmed this process - skip repeat mkdir walks
+_DIRS_READY: set = set()
+
+
+def _ensure_dir(path: Path):
+    """mkdir -p with per-process existence caching (mkdir stats every parent)."""
+    key = str(path)
+    if key in _DIRS_READY:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY.add(key)
+
 
 def estimate_tokens(text: str) -> int:
     """Rough token estimate (~4 chars per token)."""
     return len(text) // 4
 
 
+# Matches one line at a time for extract_summary's lazy scan
+_LINE_RE = re.compile(r'[^\n]+')
+
+
 def extract_summary(text: str, max_chars: int = 200) -> str:
     """Extract a meaningful summary from the beginning of text."""
-    lines = text.strip().split('\n')
     summary_lines = []
     char_count = 0
-    
-    for line in lines:
-        line = line.strip()
+
+    # Iterate lines lazily and stop at max_chars - splitting the whole text
+    # would allocate a list of every line just to keep the first handful
+    for match in _LINE_RE.finditer(text):
+        line = match.group().strip()
         if not line:
             continue
         if char_count + len(line) > max_chars:
             break
         summary_lines.append(line)
         char_count += len(line)
-    
+
     summary = ' '.join(summary_lines)
     if len(text) > len(summary):
         summary += "..."
@@ -52,25 +69,25 @@ def offload_output(tool_name: str, output: str) -> str:
     Returns either the original output or a file reference.
     """
     tokens = estimate_tokens(output)
-    
+
     if tokens < TOKEN_THRESHOLD:
         return output
-    
+
     # Ensure directory exists
-    SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    _ensure_dir(SCRATCH_DIR)
+
+    # Generate filename (time.strftime skips the datetime object)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f"{tool_name}_{timestamp}.txt"
     file_path = SCRATCH_DIR / filename
-    
+
     # Write output
     file_path.write_text(output)
-    
+
     # Generate reference
     summary = extract_summary(output)
     line_count = output.count('\n') + 1
-    
+
     return f"""[Output offloaded to filesystem]
 - File: {file_path}
 - Size: {len(output):,} chars (~{tokens:,} tokens)
@@ -80,26 +97,114 @@ def offload_output(tool_name: str, output: str) -> str:
 Use grep/sed/tail to retrieve specific content."""
 
 
+def offload_stream(tool_name: str, stream) -> str:
+    """
+    Stream a binary input to scratch, then offload or inline it by size.
+
+    Unlike offload_output, this never holds the whole output in memory:
+    input is copied to a temp file in 64KB chunks while counting bytes and
+    newlines. Small inputs are read back and returned verbatim; large ones
+    are renamed into place and summarized from their first 4KB.
+    """
+    _ensure_dir(SCRATCH_DIR)
+
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filename = f"{tool_name}_{timestamp}.txt"
+    file_path = SCRATCH_DIR / filename
+    tmp_path = SCRATCH_DIR / f".{filename}.tmp"
+
+    total_bytes = 0
+    newlines = 0
+    try:
+        with open(tmp_path, 'wb') as out:
+            while True:
+                chunk = stream.read(65536)
+                if not chunk:
+                    break
+                out.write(chunk)
+                total_bytes += len(chunk)
+                newlines += chunk.count(b'\n')
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Small output: hand it back inline, nothing to offload
+    if total_bytes < TOKEN_THRESHOLD * 4:
+        content = tmp_path.read_text(errors='replace')
+        tmp_path.unlink(missing_ok=True)
+        return content
+
+    os.replace(tmp_path, file_path)
+
+    # Summarize from the head of the file only
+    with open(file_path, 'r', errors='replace') as f:
+        summary = extract_summary(f.read(4096))
+
+    tokens = total_bytes // 4
+    line_count = newlines + 1
+
+    return f"""[Output offloaded to filesystem]
+- File: {file_path}
+- Size: {total_bytes:,} chars (~{tokens:,} tokens)
+- Lines: {line_count:,}
+- Summary: {summary}
+
+Use grep/sed/tail to retrieve specific content."""
+
+
+USAGE = f"""usage: offload_output.py --tool NAME [--input FILE] [--threshold N]
+
+Offload large tool outputs
+
+options:
+  --tool NAME    Tool name for filename (required)
+  --input FILE   Input file (default: stdin)
+  --threshold N  Token threshold (default: {TOKEN_THRESHOLD})"""
+
+
+def parse_args(argv: list) -> dict:
+    """Tiny hand-rolled parser: three flags don't justify argparse's
+    import + ArgumentParser construction cost on every invocation."""
+    args = {"tool": None, "input": None, "threshold": TOKEN_THRESHOLD}
+    it = iter(argv)
+    for arg in it:
+        if arg == "--tool":
+            args["tool"] = next(it, None)
+        elif arg == "--input":
+            args["input"] = next(it, None)
+        elif arg == "--threshold":
+            try:
+                args["threshold"] = int(next(it))
+            except (StopIteration, ValueError):
+                print(USAGE, file=sys.stderr)
+                sys.exit(2)
+        elif arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        else:
+            print(f"unrecognized argument: {arg}", file=sys.stderr)
+            print(USAGE, file=sys.stderr)
+            sys.exit(2)
+    if not args["tool"]:
+        print("--tool is required", file=sys.stderr)
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+    return args
+
+
 def main():
     global TOKEN_THRESHOLD
 
-    parser = argparse.ArgumentParser(description="Offload large tool outputs")
-    parser.add_argument("--tool", required=True, help="Tool name for filename")
-    parser.add_argument("--input", help="Input file (default: stdin)")
-    parser.add_argument("--threshold", type=int, default=TOKEN_THRESHOLD,
-                        help=f"Token threshold (default: {TOKEN_THRESHOLD})")
-
-    args = parser.parse_args()
-    TOKEN_THRESHOLD = args.threshold
-    
-    # Read input
-    if args.input:
-        output = Path(args.input).read_text()
+    args = parse_args(sys.argv[1:])
+    TOKEN_THRESHOLD = args["threshold"]
+
+    # Stream the input - never buffer the full output in memory
+    if args["input"]:
+        with open(args["input"], 'rb') as f:
+            result = offload_stream(args["tool"], f)
     else:
-        output = sys.stdin.read()
-    
-    # Process and print result
-    result = offload_output(args.tool, output)
+        result = offload_stream(args["tool"], sys.stdin.buffer)
+
     print(result)
 
 